@@ -19,6 +19,7 @@ from db.models.semester import Semester
 from db.models.student import Student
 from db.models.student_performance import StudentPerformance
 from db.models.subject import Subject
+from db.models.subject_section_stat import SubjectSectionStat
 
 # Get the absolute path to the directory containing this Python script (alembic folder)
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -0,0 +1,57 @@
+"""unique marks and student_performances
+
+Revision ID: 3c5e1f0a9d21
+Revises: b77dba5e801f
+Create Date: 2026-10-19 11:02:37.514209
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5e1f0a9d21"
+down_revision: Union[str, None] = "b77dba5e801f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # keep only the latest row of any duplicates before adding the constraints
+    op.execute(
+        """
+        DELETE FROM marks m
+        USING marks d
+        WHERE m.stud_id = d.stud_id
+          AND m.subject_id = d.subject_id
+          AND m.section_id = d.section_id
+          AND m.mark_id < d.mark_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM student_performances p
+        USING student_performances d
+        WHERE p.stud_id = d.stud_id
+          AND p.sem_id = d.sem_id
+          AND p.stud_perf_id < d.stud_perf_id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_marks_stud_subject_section",
+        "marks",
+        ["stud_id", "subject_id", "section_id"],
+    )
+    op.create_unique_constraint(
+        "uq_student_performances_stud_sem",
+        "student_performances",
+        ["stud_id", "sem_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_student_performances_stud_sem", "student_performances", type_="unique"
+    )
+    op.drop_constraint("uq_marks_stud_subject_section", "marks", type_="unique")
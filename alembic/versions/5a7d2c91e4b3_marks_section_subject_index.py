@@ -0,0 +1,27 @@
+"""marks section subject index
+
+Revision ID: 5a7d2c91e4b3
+Revises: 3c5e1f0a9d21
+Create Date: 2026-10-19 16:20:11.274903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a7d2c91e4b3"
+down_revision: Union[str, None] = "3c5e1f0a9d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_marks_section_subject", "marks", ["section_id", "subject_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marks_section_subject", table_name="marks")
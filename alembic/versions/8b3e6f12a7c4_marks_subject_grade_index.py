@@ -0,0 +1,27 @@
+"""marks subject grade index
+
+Revision ID: 8b3e6f12a7c4
+Revises: 5a7d2c91e4b3
+Create Date: 2026-10-19 16:41:52.803117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3e6f12a7c4"
+down_revision: Union[str, None] = "5a7d2c91e4b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_marks_subject_grade", "marks", ["subject_id", "grade"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_marks_subject_grade", table_name="marks")
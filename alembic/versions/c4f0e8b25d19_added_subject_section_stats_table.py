@@ -0,0 +1,94 @@
+"""added subject_section_stats table
+
+Revision ID: c4f0e8b25d19
+Revises: 8b3e6f12a7c4
+Create Date: 2026-10-19 17:05:33.419260
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f0e8b25d19"
+down_revision: Union[str, None] = "8b3e6f12a7c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTS = [
+    "students",
+    "passed",
+    "failed",
+    "absent",
+    "withheld",
+    "internal_sum",
+    "external_sum",
+    "total_sum",
+    "total_min",
+    "total_max",
+    "fcd",
+    "fc",
+    "sc",
+    "fail",
+    "grade_absent",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "subject_section_stats",
+        sa.Column("section_id", sa.Integer(), nullable=False),
+        sa.Column("subject_id", sa.Integer(), nullable=False),
+        sa.Column("sem_id", sa.Integer(), nullable=False),
+        *[sa.Column(name, sa.Integer(), nullable=False) for name in COUNTS],
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["section_id"], ["sections.section_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"], ["subjects.subject_id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["sem_id"], ["semesters.sem_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("section_id", "subject_id"),
+    )
+    op.create_index(
+        op.f("ix_subject_section_stats_sem_id"),
+        "subject_section_stats",
+        ["sem_id"],
+        unique=False,
+    )
+
+    # build the rollups of the marks stored so far
+    op.execute(
+        """
+        INSERT INTO subject_section_stats
+        SELECT m.section_id, m.subject_id, s.sem_id,
+               count(*),
+               count(*) FILTER (WHERE m.result = 'P'),
+               count(*) FILTER (WHERE m.result = 'F'),
+               count(*) FILTER (WHERE m.result = 'A'),
+               count(*) FILTER (WHERE m.result = 'W'),
+               sum(m.internal), sum(m.external), sum(m.total),
+               min(m.total), max(m.total),
+               count(*) FILTER (WHERE m.grade = 'FCD'),
+               count(*) FILTER (WHERE m.grade = 'FC'),
+               count(*) FILTER (WHERE m.grade = 'SC'),
+               count(*) FILTER (WHERE m.grade = 'FAIL'),
+               count(*) FILTER (WHERE m.grade = 'ABSENT'),
+               now(), now()
+        FROM marks m
+        JOIN subjects s ON s.subject_id = m.subject_id
+        GROUP BY m.section_id, m.subject_id, s.sem_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_subject_section_stats_sem_id"), table_name="subject_section_stats"
+    )
+    op.drop_table("subject_section_stats")
@@ -0,0 +1,41 @@
+"""student search indexes
+
+Revision ID: e2a94d7c6f08
+Revises: c4f0e8b25d19
+Create Date: 2026-10-19 17:48:06.551932
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a94d7c6f08"
+down_revision: Union[str, None] = "c4f0e8b25d19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_students_usn_prefix",
+        "students",
+        ["usn"],
+        unique=False,
+        postgresql_ops={"usn": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_students_stud_name_trgm",
+        "students",
+        ["stud_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"stud_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_students_stud_name_trgm", table_name="students")
+    op.drop_index("ix_students_usn_prefix", table_name="students")
@@ -0,0 +1,73 @@
+from typing import List
+
+import fastapi
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.utils.analytics import read_grade_distribution, read_subject_stats, read_trends
+from db.db_setup import get_db
+from pydantic_schemas.analytics import (
+    AnalyticsScopeParams,
+    GradeDistribution,
+    SubjectStats,
+    Trend,
+    TrendScopeParams,
+)
+
+router = fastapi.APIRouter()
+
+
+# Route to retrieve the grade distribution of every subject
+@router.get("/grade-distribution", response_model=List[GradeDistribution])
+async def get_grade_distribution(
+    scope: AnalyticsScopeParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve the grade distribution of every subject of a section, batch or semester.
+
+    Args:
+        scope (AnalyticsScopeParams): The section, batch and semester to count.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        List[GradeDistribution]: The count and percentage of every grade of every subject.
+    """
+    return await read_grade_distribution(db, scope)
+
+
+# Route to retrieve the precomputed statistics of every subject and section
+@router.get("/subject-stats", response_model=List[SubjectStats])
+async def get_subject_stats(
+    scope: AnalyticsScopeParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve the pass rate, averages, range and grades of every subject of every section
+    of a section, batch or semester, from the rollups.
+
+    Args:
+        scope (AnalyticsScopeParams): The section, batch and semester to read.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        List[SubjectStats]: The statistics of every subject of every section.
+    """
+    return await read_subject_stats(db, scope)
+
+
+# Route to retrieve the semester by semester trend of a student, section or batch
+@router.get("/trends", response_model=Trend)
+async def get_trends(
+    scope: TrendScopeParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve the average SGPA and percentage of every semester of a student, section or
+    batch, with the change from the previous semester.
+
+    Args:
+        scope (TrendScopeParams): The student, section and batch to follow.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        Trend: The SGPA and percentage series and their deltas.
+    """
+    return await read_trends(db, scope)
@@ -1,38 +1,54 @@
-from typing import List
-
 import fastapi
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.cache import cached_response, reference_tags
 from db.db_setup import get_db
-from pydantic_schemas.batch import Batch, BatchCreate, BatchQueryParams, BatchUpdate
+from pydantic_schemas.batch import (
+    Batch,
+    BatchCgpa,
+    BatchCreate,
+    BatchQueryParams,
+    BatchUpdate,
+)
+from pydantic_schemas.pagination import Page, PageParams
 
 from .utils.batches import (
     add_batch,
     patch_batch,
     read_batch,
     read_batches,
+    recompute_batch_cgpa,
     remove_batch,
 )
 
 router = fastapi.APIRouter()
 
 
-@router.get("", response_model=List[Batch])
+@router.get("", response_model=Page[Batch])
 async def get_batches(
-    query_params: BatchQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    request: Request,
+    query_params: BatchQueryParams = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve all batches from the database.
 
     Args:
+        request (Request): The request, for its query and If-None-Match header.
+        page (PageParams): The cursor and limit of the page.
         db (AsyncSession): An asynchronous database session.
 
     Returns:
-        List[Batch]: A list of Batch objects representing all batches in the database.
+        Page[Batch]: A page of Batch objects and the next_cursor to continue from.
     """
-    batches = await read_batches(db, query_params)
-    return batches
+    return await cached_response(
+        request,
+        reference_tags("batches"),
+        Page[Batch],
+        lambda: read_batches(db, query_params, page),
+    )
 
 
 @router.post("", response_model=Batch, status_code=201)
@@ -51,11 +67,14 @@ async def create_new_batch(batch: BatchCreate, db: AsyncSession = Depends(get_db
 
 
 @router.get("/{batch_id}", response_model=Batch)
-async def get_batch(batch_id: int, db: AsyncSession = Depends(get_db)):
+async def get_batch(
+    request: Request, batch_id: int, db: AsyncSession = Depends(get_db)
+):
     """
     Retrieve a batch from the database by its ID.
 
     Args:
+        request (Request): The request, for its If-None-Match header.
         batch_id (int): The ID of the batch to retrieve.
         db (AsyncSession): An asynchronous database session.
 
@@ -65,10 +84,16 @@ async def get_batch(batch_id: int, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If the batch with the specified ID is not found, raises 404 error.
     """
-    batch = await read_batch(batch_id=batch_id, db=db)
-    if batch is None:
-        raise HTTPException(status_code=404, detail="Batch not found.")
-    return batch
+
+    async def load():
+        batch = await read_batch(batch_id=batch_id, db=db)
+        if batch is None:
+            raise HTTPException(status_code=404, detail="Batch not found.")
+        return batch
+
+    return await cached_response(
+        request, reference_tags("batches", batch_id), Batch, load
+    )
 
 
 @router.patch("/{batch_id}", response_model=Batch)
@@ -103,3 +128,27 @@ async def delete_batch(batch_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Batch not found.")
     del_batch = await remove_batch(batch_id=batch_id, db=db)
     return del_batch
+
+
+@router.post("/{batch_id}/cgpa", response_model=BatchCgpa)
+async def recompute_cgpa(batch_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Recompute the credit-weighted CGPA of every student in a batch.
+
+    Extractions keep the CGPA of the students they touch up to date; this recomputes
+    the whole batch in one statement, e.g. after subject credits are corrected.
+
+    Args:
+        batch_id (int): The ID of the batch.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        BatchCgpa: The batch and the number of students updated.
+
+    Raises:
+        HTTPException: If the batch with the specified ID is not found, raises 404 error.
+    """
+    batch = await read_batch(batch_id=batch_id, db=db)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+    return await recompute_batch_cgpa(db=db, batch_id=batch_id)
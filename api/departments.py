@@ -1,9 +1,8 @@
-from typing import List
-
 import fastapi
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.cache import cached_response, reference_tags
 from api.utils.departments import (
     add_department,
     patch_department,
@@ -13,23 +12,34 @@ from api.utils.departments import (
 )
 from db.db_setup import get_db
 from pydantic_schemas.department import Department, DepartmentCreate, DepartmentUpdate
+from pydantic_schemas.pagination import Page, PageParams
 
 router = fastapi.APIRouter()
 
 
-@router.get("", response_model=List[Department])
-async def get_departments(db: AsyncSession = Depends(get_db)):
+@router.get("", response_model=Page[Department])
+async def get_departments(
+    request: Request,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Retrieve all departments from the database.
 
     Args:
+        request (Request): The request, for its query and If-None-Match header.
+        page (PageParams): The cursor and limit of the page.
         db (AsyncSession): An asynchronous database session.
 
     Returns:
-        List[Department]: A list of Department objects representing all departments in the database.
+        Page[Department]: A page of Department objects and the next_cursor to continue from.
     """
-    depts = await read_departments(db)
-    return depts
+    return await cached_response(
+        request,
+        reference_tags("departments"),
+        Page[Department],
+        lambda: read_departments(db, page),
+    )
 
 
 @router.post("", response_model=Department, status_code=201)
@@ -60,11 +70,14 @@ async def create_new_department(
 
 
 @router.get("/{dept_id}", response_model=Department)
-async def get_department(dept_id: int, db: AsyncSession = Depends(get_db)):
+async def get_department(
+    request: Request, dept_id: int, db: AsyncSession = Depends(get_db)
+):
     """
     Retrieve a department from the database by its ID.
 
     Args:
+        request (Request): The request, for its If-None-Match header.
         dept_id (int): The ID of the department to retrieve.
         db (AsyncSession): An asynchronous database session.
 
@@ -74,10 +87,16 @@ async def get_department(dept_id: int, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If the department with the specified ID is not found, raises 404 error.
     """
-    dept = await read_department(db=db, dept_id=dept_id)
-    if dept is None:
-        raise HTTPException(status_code=404, detail="Department not found.")
-    return dept
+
+    async def load():
+        dept = await read_department(db=db, dept_id=dept_id)
+        if dept is None:
+            raise HTTPException(status_code=404, detail="Department not found.")
+        return dept
+
+    return await cached_response(
+        request, reference_tags("departments", dept_id), Department, load
+    )
 
 
 @router.patch("/{dept_id}", response_model=Department)
@@ -0,0 +1,48 @@
+import fastapi
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
+
+from api.utils.exports import (
+    export_marks_query,
+    export_student_performances_query,
+    stream_rows,
+)
+from db.db_setup import get_session_factory
+from pydantic_schemas.export import EXPORT_MEDIA_TYPES, ExportParams
+from pydantic_schemas.mark import MarkQueryParams
+from pydantic_schemas.student_performance import StudentPerformanceQueryParams
+
+router = fastapi.APIRouter()
+
+
+def export_response(query, export: ExportParams, session_factory, name: str):
+    return StreamingResponse(
+        stream_rows(query, export, session_factory),
+        media_type=EXPORT_MEDIA_TYPES[export.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export.format}"'
+        },
+    )
+
+
+# Route to stream all marks matching the filters
+@router.get("/marks")
+async def export_marks(
+    query_params: MarkQueryParams = Depends(),
+    export: ExportParams = Depends(),
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    query = export_marks_query(query_params, export)
+    return export_response(query, export, session_factory, "marks")
+
+
+# Route to stream all student performances matching the filters
+@router.get("/student-performances")
+async def export_student_performances(
+    query_params: StudentPerformanceQueryParams = Depends(),
+    export: ExportParams = Depends(),
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    query = export_student_performances_query(query_params, export)
+    return export_response(query, export, session_factory, "student_performances")
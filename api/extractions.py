@@ -1,19 +1,38 @@
 from typing import List
 
 import fastapi
-from fastapi import BackgroundTasks, Depends, HTTPException
+from fastapi import BackgroundTasks, Depends, File, HTTPException, UploadFile
 from pydantic import HttpUrl
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from api.utils.extractions.pdf import extract_section_pdfs
 from api.utils.extractions.scraper import scrape_section
 from api.utils.extractions.subjects import add_subjects, identify_subjects
+from api.utils.extractions.table_utils import read_extractions
 from db.db_setup import get_db, get_session_factory
-from pydantic_schemas.extraction import IdentifySubjects, SubjectSchema
+from pydantic_schemas.extraction import (
+    Extraction,
+    ExtractionQueryParams,
+    IdentifySubjects,
+    SubjectSchema,
+)
+from pydantic_schemas.pagination import Page, PageParams
 
 router = fastapi.APIRouter()
 
 
+# Route to retrieve all extractions
+@router.get("", response_model=Page[Extraction])
+async def get_extractions(
+    query_params: ExtractionQueryParams = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    extractions = await read_extractions(db, query_params, page)
+    return extractions
+
+
 @router.post("/identify_subjects/{batch_id}", response_model=List[SubjectSchema])
 async def extract_subjects(
     batch_id: int,
@@ -54,3 +73,16 @@ async def scrape_section_results(
         return message
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@router.post("/pdf/{section_id}")
+async def extract_section_pdf_results(
+    section_id: int,
+    files: List[UploadFile] = File(..., description="Result PDFs or zip archives"),
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    try:
+        message = await extract_section_pdfs(section_id, files, session_factory)
+        return message
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -1,23 +1,29 @@
-from typing import List
-
 import fastapi
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.utils.marks import add_mark, patch_mark, read_mark, read_marks, remove_mark
+from api.utils.responses import RowsResponse
 from db.db_setup import get_db
 from pydantic_schemas.mark import Mark, MarkCreate, MarkQueryParams, MarkUpdate
+from pydantic_schemas.pagination import Page, PageParams
+from pydantic_schemas.projection import FieldParams
 
 router = fastapi.APIRouter()
 
 
 # Route to retrieve all marks
-@router.get("", response_model=List[Mark])
+@router.get("", response_model=Page[Mark])
 async def get_marks(
-    query_params: MarkQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    query_params: MarkQueryParams = Depends(),
+    page: PageParams = Depends(),
+    projection: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
-    marks = await read_marks(db, query_params)
-    return marks
+    marks = await read_marks(db, query_params, page, projection.fields)
+    # the rows come straight from the database, so they are encoded with orjson
+    # without being validated against the response model again
+    return RowsResponse(marks)
 
 
 # Route to create a new mark
@@ -29,10 +35,16 @@ async def create_new_mark(mark: MarkCreate, db: AsyncSession = Depends(get_db)):
 
 # Route to retrieve a specific mark by its ID
 @router.get("/{mark_id}", response_model=Mark)
-async def get_mark(mark_id: int, db: AsyncSession = Depends(get_db)):
-    mark = await read_mark(db, mark_id)
+async def get_mark(
+    mark_id: int,
+    projection: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    mark = await read_mark(db, mark_id, projection.fields)
     if mark is None:
         raise HTTPException(status_code=404, detail="Mark not found")
+    if projection.fields:
+        return RowsResponse(mark)
     return mark
 
 
@@ -0,0 +1,59 @@
+from typing import List
+
+import fastapi
+from fastapi import Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.utils.rankings import read_rankings, read_student_rank
+from db.db_setup import get_db
+from pydantic_schemas.ranking import Ranking, RankingParams
+
+router = fastapi.APIRouter()
+
+
+# Route to retrieve the top students of a section, batch or semester
+@router.get("", response_model=List[Ranking])
+async def get_rankings(
+    params: RankingParams = Depends(),
+    top: int = Query(10, ge=1, le=1000, description="Lowest rank returned"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieve the students ranked within the top of a section, batch or semester.
+
+    Args:
+        params (RankingParams): The semester, scope, metric and tie handling.
+        top (int): The lowest rank returned, students tied at it are all included.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        List[Ranking]: The rank, student and performance of the top students.
+    """
+    return await read_rankings(db, params, top)
+
+
+# Route to retrieve the rank of a specific student
+@router.get("/students/{stud_id}", response_model=Ranking)
+async def get_student_rank(
+    stud_id: int,
+    params: RankingParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieve the rank of a student in a section, batch or semester.
+
+    Args:
+        stud_id (int): The ID of the student.
+        params (RankingParams): The semester, scope, metric and tie handling.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        Ranking: The rank, student and performance of the student.
+
+    Raises:
+        HTTPException: If the student has no performance in the scope (status code 404).
+    """
+    rank = await read_student_rank(db, stud_id, params)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="Student performance not found")
+    return rank
@@ -1,18 +1,20 @@
-from typing import List
-
 import fastapi
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.cache import cached_response, reference_tags
 from api.utils.sections import (
     add_section,
     patch_section,
+    read_result_sheet,
     read_section,
     read_sections,
     remove_section,
 )
 from db.db_setup import get_db
+from pydantic_schemas.pagination import Page, PageParams
 from pydantic_schemas.section import (
+    ResultSheet,
     Section,
     SectionCreate,
     SectionQueryParams,
@@ -23,21 +25,30 @@ router = fastapi.APIRouter()
 
 
 # Route to retrieve all sections
-@router.get("", response_model=List[Section])
+@router.get("", response_model=Page[Section])
 async def get_sections(
-    query_params: SectionQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    request: Request,
+    query_params: SectionQueryParams = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve all sections.
 
     Args:
+        request (Request): The request, for its query and If-None-Match header.
+        page (PageParams): The cursor and limit of the page.
         db (AsyncSession): An asynchronous database session.
 
     Returns:
-        List[Section]: A list of Section objects representing all sections in the database.
+        Page[Section]: A page of Section objects and the next_cursor to continue from.
     """
-    sections = await read_sections(db, query_params)
-    return sections
+    return await cached_response(
+        request,
+        reference_tags("sections"),
+        Page[Section],
+        lambda: read_sections(db, query_params, page),
+    )
 
 
 # Route to create a new section
@@ -63,11 +74,14 @@ async def create_new_section(
 
 # Route to retrieve a specific section by its ID
 @router.get("/{section_id}", response_model=Section)
-async def get_section(section_id: int, db: AsyncSession = Depends(get_db)):
+async def get_section(
+    request: Request, section_id: int, db: AsyncSession = Depends(get_db)
+):
     """
     Retrieve a specific section by its ID.
 
     Args:
+        request (Request): The request, for its If-None-Match header.
         section_id (int): The ID of the section to retrieve.
         db (AsyncSession): An asynchronous database session.
 
@@ -77,10 +91,16 @@ async def get_section(section_id: int, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If the section with the specified ID is not found.
     """
-    section = await read_section(db, section_id)
-    if section is None:
-        raise HTTPException(status_code=404, detail="Section not found")
-    return section
+
+    async def load():
+        section = await read_section(db, section_id)
+        if section is None:
+            raise HTTPException(status_code=404, detail="Section not found")
+        return section
+
+    return await cached_response(
+        request, reference_tags("sections", section_id), Section, load
+    )
 
 
 # Route to update a specific section by its ID
@@ -132,3 +152,31 @@ async def delete_section(section_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Section not found")
     section = await remove_section(db, section_id)
     return section
+
+
+# Route to retrieve the result sheet of a section
+@router.get("/{section_id}/result-sheet", response_model=ResultSheet)
+async def get_result_sheet(
+    section_id: int,
+    sem_id: int = Query(..., description="Semester ID"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Retrieve the result sheet of a section for a semester.
+
+    Args:
+        section_id (int): The ID of the section.
+        sem_id (int): The ID of the semester.
+        db (AsyncSession): An asynchronous database session.
+
+    Returns:
+        ResultSheet: The internal, external, total and result of every subject of every
+            student, with their total, percentage and SGPA.
+
+    Raises:
+        HTTPException: If the section with the specified ID is not found.
+    """
+    result_sheet = await read_result_sheet(db, section_id, sem_id)
+    if result_sheet is None:
+        raise HTTPException(status_code=404, detail="Section not found")
+    return result_sheet
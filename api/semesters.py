@@ -1,9 +1,8 @@
-from typing import List
-
 import fastapi
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.cache import cached_response, reference_tags
 from api.utils.semesters import (
     add_semester,
     patch_semester,
@@ -12,6 +11,7 @@ from api.utils.semesters import (
     remove_semester,
 )
 from db.db_setup import get_db
+from pydantic_schemas.pagination import Page, PageParams
 from pydantic_schemas.semester import (
     Semester,
     SemesterCreate,
@@ -22,21 +22,30 @@ from pydantic_schemas.semester import (
 router = fastapi.APIRouter()
 
 
-@router.get("", response_model=List[Semester])
+@router.get("", response_model=Page[Semester])
 async def get_semesters(
-    query_params: SemesterQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    request: Request,
+    query_params: SemesterQueryParams = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieves all semesters.
 
     Args:
+        request (Request): The request, for its query and If-None-Match header.
+        page (PageParams): The cursor and limit of the page.
         db (AsyncSession): The async database session.
 
     Returns:
-        List[Semester]: A list of Semester objects.
+        Page[Semester]: A page of Semester objects and the next_cursor to continue from.
     """
-    semesters = await read_semesters(db, query_params)
-    return semesters
+    return await cached_response(
+        request,
+        reference_tags("semesters"),
+        Page[Semester],
+        lambda: read_semesters(db, query_params, page),
+    )
 
 
 @router.post("", response_model=Semester, status_code=201)
@@ -57,21 +66,30 @@ async def create_new_semester(
 
 
 @router.get("/{sem_id}", response_model=Semester)
-async def get_semester(sem_id: int, db: AsyncSession = Depends(get_db)):
+async def get_semester(
+    request: Request, sem_id: int, db: AsyncSession = Depends(get_db)
+):
     """
     Retrieves a single semester by its ID.
 
     Args:
+        request (Request): The request, for its If-None-Match header.
         sem_id (int): The ID of the semester to retrieve.
         db (AsyncSession): The async database session.
 
     Returns:
         Semester: The retrieved Semester object.
     """
-    semester = await read_semester(db=db, sem_id=sem_id)
-    if semester is None:
-        raise HTTPException(status_code=404, detail="Semester not found")
-    return semester
+
+    async def load():
+        semester = await read_semester(db=db, sem_id=sem_id)
+        if semester is None:
+            raise HTTPException(status_code=404, detail="Semester not found")
+        return semester
+
+    return await cached_response(
+        request, reference_tags("semesters", sem_id), Semester, load
+    )
 
 
 @router.patch("/{sem_id}", response_model=Semester)
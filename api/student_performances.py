@@ -1,9 +1,8 @@
-from typing import List
-
 import fastapi
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.responses import RowsResponse
 from api.utils.student_performances import (
     add_student_performance,
     patch_student_performance,
@@ -12,6 +11,7 @@ from api.utils.student_performances import (
     remove_student_performance,
 )
 from db.db_setup import get_db
+from pydantic_schemas.pagination import Page, PageParams
 from pydantic_schemas.student_performance import (
     StudentPerformance,
     StudentPerformanceCreate,
@@ -23,13 +23,16 @@ router = fastapi.APIRouter()
 
 
 # Route to retrieve all student performances
-@router.get("", response_model=List[StudentPerformance])
+@router.get("", response_model=Page[StudentPerformance])
 async def get_student_performances(
     query_params: StudentPerformanceQueryParams = Depends(),
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
 ):
-    student_performances = await read_student_performances(db, query_params)
-    return student_performances
+    student_performances = await read_student_performances(db, query_params, page)
+    # the rows come straight from the database, so they are encoded with orjson
+    # without being validated against the response model again
+    return RowsResponse(student_performances)
 
 
 # Route to create a new student performance
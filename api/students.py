@@ -4,18 +4,26 @@ import fastapi
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.responses import RowsResponse
 from api.utils.students import (
     add_student,
     patch_student,
     read_student,
+    read_student_profile,
     read_students,
     remove_student,
+    search_students,
 )
 from db.db_setup import get_db
+from pydantic_schemas.pagination import Page, PageParams
+from pydantic_schemas.projection import FieldParams
 from pydantic_schemas.student import (
     Student,
     StudentCreate,
+    StudentProfile,
     StudentQueryParams,
+    StudentSearchParams,
+    StudentSearchResult,
     StudentUpdate,
 )
 
@@ -23,12 +31,17 @@ router = fastapi.APIRouter()
 
 
 # Route to retrieve all students
-@router.get("", response_model=List[Student])
+@router.get("", response_model=Page[Student])
 async def get_students(
-    query_params: StudentQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    query_params: StudentQueryParams = Depends(),
+    page: PageParams = Depends(),
+    projection: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
-    students = await read_students(db, query_params)
-    return students
+    students = await read_students(db, query_params, page, projection.fields)
+    # the rows come straight from the database, so they are encoded with orjson
+    # without being validated against the response model again
+    return RowsResponse(students)
 
 
 # Route to create a new student
@@ -40,15 +53,39 @@ async def create_new_student(
     return student
 
 
+# Route to search students by USN or name, declared before /{student_id}
+@router.get("/search", response_model=List[StudentSearchResult])
+async def get_student_search(
+    params: StudentSearchParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    students = await search_students(db, params)
+    return students
+
+
 # Route to retrieve a specific student by its ID
 @router.get("/{student_id}", response_model=Student)
-async def get_student(student_id: int, db: AsyncSession = Depends(get_db)):
-    student = await read_student(db, student_id)
+async def get_student(
+    student_id: int,
+    projection: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+):
+    student = await read_student(db, student_id, projection.fields)
     if student is None:
         raise HTTPException(status_code=404, detail="Student not found")
+    if projection.fields:
+        return RowsResponse(student)
     return student
 
 
+# Route to retrieve a student with its performances and marks
+@router.get("/{student_id}/profile", response_model=StudentProfile)
+async def get_student_profile(student_id: int, db: AsyncSession = Depends(get_db)):
+    profile = await read_student_profile(db, student_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return profile
+
+
 # Route to update a specific student by its ID
 @router.patch("/{student_id}", response_model=Student)
 async def update_student(
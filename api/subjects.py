@@ -1,9 +1,8 @@
-from typing import List
-
 import fastapi
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.utils.cache import cached_response, reference_tags
 from api.utils.subjects import (
     add_subject,
     patch_subject,
@@ -12,6 +11,7 @@ from api.utils.subjects import (
     remove_subject,
 )
 from db.db_setup import get_db
+from pydantic_schemas.pagination import Page, PageParams
 from pydantic_schemas.subject import (
     Subject,
     SubjectCreate,
@@ -23,12 +23,19 @@ router = fastapi.APIRouter()
 
 
 # Route to retrieve all subjects
-@router.get("", response_model=List[Subject])
+@router.get("", response_model=Page[Subject])
 async def get_subjects(
-    query_params: SubjectQueryParams = Depends(), db: AsyncSession = Depends(get_db)
+    request: Request,
+    query_params: SubjectQueryParams = Depends(),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db),
 ):
-    subjects = await read_subjects(db, query_params)
-    return subjects
+    return await cached_response(
+        request,
+        reference_tags("subjects"),
+        Page[Subject],
+        lambda: read_subjects(db, query_params, page),
+    )
 
 
 # Route to create a new subject
@@ -42,11 +49,18 @@ async def create_new_subject(
 
 # Route to retrieve a specific subject by its ID
 @router.get("/{subject_id}", response_model=Subject)
-async def get_subject(subject_id: int, db: AsyncSession = Depends(get_db)):
-    subject = await read_subject(db, subject_id)
-    if subject is None:
-        raise HTTPException(status_code=404, detail="Subject not found")
-    return subject
+async def get_subject(
+    request: Request, subject_id: int, db: AsyncSession = Depends(get_db)
+):
+    async def load():
+        subject = await read_subject(db, subject_id)
+        if subject is None:
+            raise HTTPException(status_code=404, detail="Subject not found")
+        return subject
+
+    return await cached_response(
+        request, reference_tags("subjects", subject_id), Subject, load
+    )
 
 
 # Route to update a specific subject by its ID
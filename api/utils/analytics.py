@@ -0,0 +1,243 @@
+from collections import defaultdict
+from typing import List
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.utils.cache import cached_query, cached_result, scope_tags, semester_tags
+from db.models.mark import Mark
+from db.models.semester import Semester
+from db.models.student import Student
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+from db.models.subject_section_stat import SubjectSectionStat
+from pydantic_schemas.analytics import GRADES, AnalyticsScopeParams, TrendScopeParams
+
+
+def scope_filters(scope: AnalyticsScopeParams) -> list:
+    """Build the filters on marks of the section, batch and semester of the scope."""
+    filters = []
+    if scope.section_id:
+        filters.append(Mark.section_id == scope.section_id)
+    if scope.sem_id:
+        filters.append(
+            Mark.subject_id.in_(
+                select(Subject.subject_id).where(Subject.sem_id == scope.sem_id)
+            )
+        )
+    if scope.batch_id:
+        filters.append(
+            Mark.subject_id.in_(
+                select(Subject.subject_id)
+                .join(Semester, Semester.sem_id == Subject.sem_id)
+                .where(Semester.batch_id == scope.batch_id)
+            )
+        )
+    return filters
+
+
+def _scope_tags(scope: AnalyticsScopeParams) -> list:
+    return scope_tags(scope.section_id, scope.batch_id, scope.sem_id)
+
+
+@cached_result("grade-distribution", _scope_tags)
+async def read_grade_distribution(
+    db: AsyncSession, scope: AnalyticsScopeParams
+) -> List[dict]:
+    """
+    Count the grades of every subject of a section, batch or semester.
+
+    The counts come from one GROUP BY subject_id, grade over marks, served from the
+    (subject_id, grade) index, and only the few grouped rows reach Python.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        scope (AnalyticsScopeParams): The section, batch and semester to count.
+
+    Returns:
+        List[dict]: The number of students, count and percentage of every grade of
+            every subject, in subject code order.
+    """
+    counts = (
+        select(Mark.subject_id, Mark.grade, func.count().label("count"))
+        .where(and_(*scope_filters(scope)))
+        .group_by(Mark.subject_id, Mark.grade)
+        .subquery()
+    )
+    query = (
+        select(
+            Subject.subject_id,
+            Subject.sub_code,
+            Subject.sub_name,
+            counts.c.grade,
+            counts.c.count,
+        )
+        .join(counts, counts.c.subject_id == Subject.subject_id)
+        .order_by(Subject.sub_code)
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        rows = result.all()
+
+    subjects = {}
+    grade_counts = defaultdict(dict)
+    for row in rows:
+        subjects[row.subject_id] = row
+        grade_counts[row.subject_id][row.grade] = row.count
+
+    distribution = []
+    for subject_id, subject in subjects.items():
+        grades = {grade: grade_counts[subject_id].get(grade, 0) for grade in GRADES}
+        students = sum(grade_counts[subject_id].values())
+        distribution.append(
+            {
+                "subject_id": subject_id,
+                "sub_code": subject.sub_code,
+                "sub_name": subject.sub_name,
+                "students": students,
+                "counts": grades,
+                "percentages": {
+                    grade: round(count * 100 / students, 2)
+                    for grade, count in grades.items()
+                },
+            }
+        )
+    return distribution
+
+
+@cached_result("subject-stats", _scope_tags)
+async def read_subject_stats(
+    db: AsyncSession, scope: AnalyticsScopeParams
+) -> List[dict]:
+    """
+    Read the rollups of every subject and section of a section, batch or semester.
+
+    The rollups are kept up to date by the extractions and mark updates, so this reads
+    one row per subject and section instead of aggregating the marks.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        scope (AnalyticsScopeParams): The section, batch and semester to read.
+
+    Returns:
+        List[dict]: The pass, fail and grade counts and the averages of every subject of
+            every section, in section and subject code order.
+    """
+    filters = []
+    if scope.section_id:
+        filters.append(SubjectSectionStat.section_id == scope.section_id)
+    if scope.sem_id:
+        filters.append(SubjectSectionStat.sem_id == scope.sem_id)
+    if scope.batch_id:
+        filters.append(
+            SubjectSectionStat.sem_id.in_(
+                select(Semester.sem_id).where(Semester.batch_id == scope.batch_id)
+            )
+        )
+    query = (
+        select(SubjectSectionStat, Subject.sub_code)
+        .join(Subject, Subject.subject_id == SubjectSectionStat.subject_id)
+        .where(and_(*filters))
+        .order_by(SubjectSectionStat.section_id, Subject.sub_code)
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        rows = result.all()
+
+    return [
+        {
+            "section_id": stat.section_id,
+            "subject_id": stat.subject_id,
+            "sem_id": stat.sem_id,
+            "sub_code": sub_code,
+            "students": stat.students,
+            "passed": stat.passed,
+            "failed": stat.failed,
+            "absent": stat.absent,
+            "withheld": stat.withheld,
+            "pass_percentage": round(stat.passed * 100 / stat.students, 2),
+            "average_internal": round(stat.internal_sum / stat.students, 2),
+            "average_external": round(stat.external_sum / stat.students, 2),
+            "average_total": round(stat.total_sum / stat.students, 2),
+            "total_min": stat.total_min,
+            "total_max": stat.total_max,
+            "grades": dict(
+                zip(
+                    GRADES,
+                    [stat.fcd, stat.fc, stat.sc, stat.fail, stat.grade_absent],
+                )
+            ),
+        }
+        for stat, sub_code in rows
+    ]
+
+
+async def read_trends(db: AsyncSession, scope: TrendScopeParams) -> dict:
+    """
+    Follow the SGPA and percentage of a student, section or batch across semesters.
+
+    One query groups the performances by semester and computes the change from the
+    previous semester with lag() over sem_num. The result is cached until an extraction
+    of its batch or a performance update touches it.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        scope (TrendScopeParams): The student, section and batch to follow.
+
+    Returns:
+        dict: The average SGPA and percentage of every semester and their deltas.
+    """
+    filters = []
+    if scope.stud_id:
+        filters.append(StudentPerformance.stud_id == scope.stud_id)
+    if scope.section_id:
+        filters.append(Student.section_id == scope.section_id)
+    if scope.batch_id:
+        filters.append(Student.batch_id == scope.batch_id)
+
+    sgpa = func.round(func.avg(StudentPerformance.sgpa), 2)
+    percentage = func.round(func.avg(StudentPerformance.percentage), 2)
+    previous = {"order_by": Semester.sem_num}
+    query = (
+        select(
+            Semester.sem_id,
+            Semester.sem_num,
+            Semester.batch_id,
+            func.count().label("students"),
+            sgpa.label("sgpa"),
+            percentage.label("percentage"),
+            (sgpa - func.lag(sgpa).over(**previous)).label("sgpa_delta"),
+            (percentage - func.lag(percentage).over(**previous)).label(
+                "percentage_delta"
+            ),
+        )
+        .join(Semester, Semester.sem_id == StudentPerformance.sem_id)
+        .join(Student, Student.stud_id == StudentPerformance.stud_id)
+        .where(and_(*filters))
+        .group_by(Semester.sem_id, Semester.sem_num, Semester.batch_id)
+        .order_by(Semester.sem_num)
+    )
+
+    async def load():
+        async with db.begin():
+            result = await db.execute(query)
+            semesters = [dict(row) for row in result.mappings()]
+        return {
+            "stud_id": scope.stud_id,
+            "section_id": scope.section_id,
+            "batch_id": scope.batch_id,
+            "semesters": semesters,
+        }
+
+    # tagged with the batch too, so an extraction of a new semester drops it
+    def tags(trend: dict) -> list:
+        semesters = trend["semesters"]
+        batch_ids = {semester["batch_id"] for semester in semesters}
+        return [
+            *scope_tags(scope.section_id),
+            *[("batch", batch_id) for batch_id in batch_ids],
+            *semester_tags(semester["sem_id"] for semester in semesters),
+        ]
+
+    key = ("trends", scope.stud_id, scope.section_id, scope.batch_id)
+    return await cached_query(key, tags, load)
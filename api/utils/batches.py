@@ -1,24 +1,29 @@
-from typing import Sequence
-
 from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import invalidate_reference
+from api.utils.cgpa import recompute_cgpa
+from api.utils.pagination import page_of, paginate
 from db.models.batch import Batch
 from pydantic_schemas.batch import BatchCreate, BatchQueryParams, BatchUpdate
+from pydantic_schemas.pagination import PageParams
 
 
 async def read_batches(
-    db: AsyncSession, query_params: BatchQueryParams
-) -> Sequence[Batch]:
+    db: AsyncSession,
+    query_params: BatchQueryParams,
+    page: PageParams,
+) -> dict:
     """
     Retrieve all batches from the database.
 
     Args:
         db (AsyncSession): An asynchronous database session.
+        page (PageParams): The cursor and limit of the page.
 
     Returns:
-        Sequence[Batch]: sequence of batches retrieved of type Batch
+        dict: A page of Batch objects in batch_id order and the next_cursor to continue from.
     """
     filters = []
     if query_params.dept_id:
@@ -34,10 +39,10 @@ async def read_batches(
     if query_params.max_students:
         filters.append(Batch.num_students <= query_params.max_students)
     async with db.begin():
-        query = select(Batch).where(and_(*filters))
+        query = paginate(select(Batch).where(and_(*filters)), Batch.batch_id, page)
         result = await db.execute(query)
         batches = result.scalars().all()
-        return batches
+        return page_of(batches, Batch.batch_id, page)
 
 
 async def add_batch(db: AsyncSession, batch: BatchCreate) -> Batch:
@@ -66,6 +71,7 @@ async def add_batch(db: AsyncSession, batch: BatchCreate) -> Batch:
         )
         db.add(new_batch)
         await db.commit()
+        await invalidate_reference("batches")
         return new_batch
 
 
@@ -119,6 +125,7 @@ async def patch_batch(
             )
             await db.execute(query)
             await db.commit()
+            await invalidate_reference("batches", batch_id)
 
     new_batch = await read_batch(db=db, batch_id=batch_id)
     return new_batch
@@ -129,4 +136,22 @@ async def remove_batch(db: AsyncSession, batch_id: int) -> Batch:
     async with db.begin():
         await db.delete(batch)
         await db.commit()
+        await invalidate_reference("batches", batch_id, deleted=True)
     return batch
+
+
+async def recompute_batch_cgpa(db: AsyncSession, batch_id: int) -> dict:
+    """
+    Recompute the credit-weighted CGPA of every student in a batch.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        batch_id (int): The ID of the batch.
+
+    Returns:
+        dict: The batch_id and the number of students updated.
+    """
+    async with db.begin():
+        students = await recompute_cgpa(db, batch_id=batch_id)
+        await db.commit()
+    return {"batch_id": batch_id, "students": students}
@@ -0,0 +1,375 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+import redis.asyncio as redis
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+# returned by get on a miss, since None can be a cached value
+MISSING = object()
+
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+# safety net only, entries are normally dropped by the writes that make them stale
+CACHE_TTL = float(os.getenv("CACHE_TTL", "300"))
+# e.g. redis://redis:6379/1, shares hot results and invalidations between workers
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+CACHE_PREFIX = "eduinsights:cache:"
+INVALIDATION_CHANNEL = CACHE_PREFIX + "invalidate"
+
+# what a delete cascades to (ondelete="CASCADE") among the reference data
+REFERENCE_CASCADES = {
+    "departments": ("batches", "semesters", "subjects", "sections"),
+    "batches": ("semesters", "subjects", "sections"),
+    "semesters": ("subjects",),
+}
+
+
+class TaggedCache:
+    """
+    An in-process LRU cache of query results, tagged with what they were computed from.
+
+    Every entry is stored with tags such as ("semester", 3). Writes invalidate the tags
+    they touch, which drops every entry carrying one of them, so an entry lives until
+    its data changes, its ttl runs out or it is the least recently used of max_entries.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (value, expires_at, tags), least recently used first
+        self._entries = OrderedDict()
+        self._tags = defaultdict(set)
+        # bumped by every invalidation, so a read that raced a write is not cached
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        value, expires_at, _ = entry
+        if expires_at < time.monotonic():
+            self._drop(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[Hashable],
+        ttl: Optional[float] = None,
+    ):
+        self._drop(key)
+        tags = tuple(tags)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at, tags)
+        for tag in tags:
+            self._tags[tag].add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *tags: Hashable):
+        self.generation += 1
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._drop(key)
+
+    def _drop(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def _encode_tags(tags: Iterable[Hashable]) -> str:
+    return json.dumps([list(tag) if isinstance(tag, tuple) else tag for tag in tags])
+
+
+def _decode_tags(message: bytes) -> list:
+    return [tuple(tag) if isinstance(tag, list) else tag for tag in json.loads(message)]
+
+
+class SharedCache:
+    """
+    A cache of hot query results shared by every API worker through Redis.
+
+    Results are pickled under a hash of their key and every tag is a Redis set of the
+    keys carrying it, so an invalidation deletes them for all workers at once. It is
+    also published on INVALIDATION_CHANNEL, which every worker listens to in order to
+    drop the same tags from its own in-process cache.
+
+    Without a Redis URL, or while Redis is unreachable, results are kept in the
+    in-process cache and the workers only share the database.
+    """
+
+    def __init__(self, url: Optional[str], local: TaggedCache, ttl: float = CACHE_TTL):
+        self.local = local
+        self.ttl = ttl
+        self.url = url
+        # short timeouts, an unreachable Redis must not stall the requests
+        self.redis = (
+            redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+            if url
+            else None
+        )
+        self._listener = None
+
+    def _key(self, key: Hashable) -> str:
+        return CACHE_PREFIX + hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _tag(self, tag: Hashable) -> str:
+        return CACHE_PREFIX + "tag:" + repr(tag)
+
+    async def get(self, key: Hashable) -> Any:
+        if self.redis is None:
+            return self.local.get(key)
+        try:
+            value = await self.redis.get(self._key(key))
+        except RedisError as e:
+            print("Shared cache unavailable:", e, flush=True)
+            return self.local.get(key)
+        return MISSING if value is None else pickle.loads(value)
+
+    async def set(self, key: Hashable, value: Any, tags: Iterable[Hashable]):
+        tags = tuple(tags)
+        if self.redis is None:
+            self.local.set(key, value, tags)
+            return
+        name = self._key(key)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(name, pickle.dumps(value), ex=int(self.ttl))
+                for tag in tags:
+                    pipe.sadd(self._tag(tag), name)
+                    pipe.expire(self._tag(tag), int(self.ttl))
+                await pipe.execute()
+        except RedisError as e:
+            print("Shared cache unavailable:", e, flush=True)
+            self.local.set(key, value, tags)
+
+    async def invalidate(self, *tags: Hashable):
+        """Drop the tagged entries here, in Redis and in the cache of every worker."""
+        self.local.invalidate(*tags)
+        if self.redis is None or not tags:
+            return
+        names = [self._tag(tag) for tag in tags]
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.smembers(name)
+                keys = set().union(*await pipe.execute())
+            await self.redis.delete(*keys, *names)
+            await self.redis.publish(INVALIDATION_CHANNEL, _encode_tags(tags))
+        except RedisError as e:
+            print("Shared cache invalidation failed:", e, flush=True)
+
+    async def _listen(self):
+        while True:
+            try:
+                # its own connection, without the read timeout as it waits idle
+                listener = redis.from_url(self.url, socket_connect_timeout=1)
+                async with listener, listener.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.local.invalidate(*_decode_tags(message["data"]))
+            except RedisError as e:
+                print("Cache invalidation listener reconnecting:", e, flush=True)
+                # whatever was missed meanwhile is bounded by the ttl
+                await asyncio.sleep(1)
+
+    def start(self):
+        """Listen for the invalidations of the other workers, called at startup."""
+        if self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        if self.redis is not None:
+            await self.redis.aclose()
+
+
+# shared by every request of the process
+cache = TaggedCache()
+# shared by every worker when CACHE_REDIS_URL is set
+shared_cache = SharedCache(CACHE_REDIS_URL, cache)
+
+
+def semester_tags(sem_ids: Iterable[int]) -> list:
+    return [("semester", sem_id) for sem_id in sem_ids]
+
+
+def scope_tags(
+    section_id: Optional[int] = None,
+    batch_id: Optional[int] = None,
+    sem_id: Optional[int] = None,
+) -> list:
+    """
+    Tags of a result scoped to a section, batch and/or semester.
+
+    Any one of them matching a write is enough to drop the result, which is why a
+    scoped result carries a tag for every part of its scope.
+    """
+    tags = []
+    if section_id:
+        tags.append(("section", section_id))
+    if batch_id:
+        tags.append(("batch", batch_id))
+    if sem_id:
+        tags.append(("semester", sem_id))
+    return tags
+
+
+def extraction_tags(batch_id: int, section_id: int, sem_id: int) -> list:
+    """Tags of the results an extraction of a section for a semester makes stale."""
+    return scope_tags(section_id, batch_id, sem_id)
+
+
+def _normalize(value: Any) -> Hashable:
+    # query parameter classes are plain objects holding the parsed parameters
+    if hasattr(value, "__dict__"):
+        return tuple(sorted(vars(value).items()))
+    return value
+
+
+async def cached_query(
+    key: Hashable,
+    tags: Callable[[Any], Iterable[Hashable]],
+    load: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Serve a hot query result from the shared cache, loading and storing it on a miss.
+
+    tags is called with the loaded result, as some results are tagged with what they
+    contain. A result loaded while one of this worker's entries was invalidated is not
+    stored, as it may predate the write.
+    """
+    value = await shared_cache.get(key)
+    if value is not MISSING:
+        return value
+    generation = cache.generation
+    value = await load()
+    if cache.generation == generation:
+        await shared_cache.set(key, value, ["results", *tags(value)])
+    return value
+
+
+def cached_result(name: str, tags: Callable[..., Iterable[Hashable]]):
+    """
+    Cache what the decorated read util returns in the shared cache.
+
+    The result is keyed by name and the normalized arguments other than the session,
+    and tagged with tags(**arguments), e.g. the scope it was computed for.
+    """
+
+    def decorator(read):
+        signature = inspect.signature(read)
+
+        @functools.wraps(read)
+        async def wrapper(db, *args, **kwargs):
+            arguments = signature.bind(db, *args, **kwargs).arguments
+            arguments.pop("db")
+            key = (name, *((arg, _normalize(v)) for arg, v in arguments.items()))
+            return await cached_query(
+                key,
+                lambda _: tags(**arguments),
+                lambda: read(db, *args, **kwargs),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def reference_tags(namespace: str, item_id: Optional[int] = None) -> list:
+    """Tags of a cached list of reference data, or of one item when item_id is given."""
+    return [namespace, (namespace, "list" if item_id is None else item_id)]
+
+
+async def invalidate_reference(
+    namespace: str, item_id: Optional[int] = None, deleted: bool = False
+):
+    """
+    Drop the cached lists of a kind of reference data, and the item written if given.
+
+    A delete also drops everything its foreign keys cascade to, including the hot
+    results computed from the marks and performances it deleted.
+    """
+    tags = [(namespace, "list")]
+    if item_id is not None:
+        tags.append((namespace, item_id))
+    if deleted:
+        tags.extend(REFERENCE_CASCADES.get(namespace, ()))
+        tags.append("results")
+    await shared_cache.invalidate(*tags)
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
+
+
+async def cached_response(
+    request: Request,
+    tags: Iterable[Hashable],
+    response_model,
+    load: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    Serve a read from the cache, keyed by its path and normalized query parameters.
+
+    On a miss load() is awaited and its result serialized with response_model, so the
+    cache holds immutable JSON rather than ORM objects bound to a session. Responses
+    carry an ETag of their body and a matching If-None-Match gets a bodyless 304.
+    Exceptions from load(), e.g. a 404, are raised and nothing is cached.
+    """
+    key = (
+        "response",
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+    )
+    entry = cache.get(key)
+    if entry is MISSING:
+        generation = cache.generation
+        content = await load()
+        body = _adapter(response_model).dump_json(
+            _adapter(response_model).validate_python(content, from_attributes=True)
+        )
+        entry = (body, _etag(body))
+        if cache.generation == generation:
+            cache.set(key, entry, tags)
+
+    body, etag = entry
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
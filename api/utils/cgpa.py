@@ -0,0 +1,92 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models.mark import Mark
+from db.models.student import Student
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+
+
+def cgpa_query(stud_ids):
+    """
+    Credit-weighted CGPA of the given students, a list or a select of stud_ids.
+
+    Each semester's SGPA is weighted by the credits of the subjects the student has
+    marks for in that semester, so electives and dropped subjects are accounted for.
+    """
+    credits = (
+        select(
+            Mark.stud_id,
+            Subject.sem_id,
+            func.sum(Subject.credits).label("credits"),
+        )
+        .join(Subject, Subject.subject_id == Mark.subject_id)
+        .where(Mark.stud_id.in_(stud_ids))
+        .group_by(Mark.stud_id, Subject.sem_id)
+        .subquery()
+    )
+    return (
+        select(
+            StudentPerformance.stud_id,
+            func.round(
+                func.sum(StudentPerformance.sgpa * credits.c.credits)
+                / func.nullif(func.sum(credits.c.credits), 0),
+                1,
+            ).label("cgpa"),
+        )
+        .join(
+            credits,
+            and_(
+                credits.c.stud_id == StudentPerformance.stud_id,
+                credits.c.sem_id == StudentPerformance.sem_id,
+            ),
+        )
+        .where(StudentPerformance.stud_id.in_(stud_ids))
+        .group_by(StudentPerformance.stud_id)
+    )
+
+
+async def recompute_cgpa(
+    db: AsyncSession,
+    batch_id: Optional[int] = None,
+    stud_ids: Optional[Iterable[int]] = None,
+) -> int:
+    """
+    Recompute Student.cgpa from the semester performances in one UPDATE.
+
+    Either every student of a batch or only the given students are recomputed, the
+    latter after an extraction or a performance write touches them. Runs in the
+    caller's transaction.
+
+    Args:
+        db (AsyncSession): An asynchronous database session, in a transaction.
+        batch_id (int, optional): The batch whose students are recomputed.
+        stud_ids (Iterable[int], optional): The students to recompute.
+
+    Returns:
+        int: The number of students updated.
+    """
+    filters = []
+    if batch_id is not None:
+        filters.append(Student.batch_id == batch_id)
+    if stud_ids is not None:
+        filters.append(Student.stud_id.in_(list(stud_ids)))
+    scope = select(Student.stud_id).where(and_(*filters))
+
+    # outer join so students left without performances are reset to 0
+    cgpas = cgpa_query(scope).subquery()
+    scoped = (
+        scope.add_columns(cgpas.c.cgpa)
+        .outerjoin(cgpas, cgpas.c.stud_id == Student.stud_id)
+        .subquery()
+    )
+    query = (
+        update(Student)
+        .where(Student.stud_id == scoped.c.stud_id)
+        .values(cgpa=func.coalesce(scoped.c.cgpa, 0), updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(query)
+    return result.rowcount
@@ -1,28 +1,35 @@
-from typing import Optional, Sequence
+from typing import Optional
 
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import invalidate_reference
+from api.utils.pagination import page_of, paginate
 from db.models.department import Department
 from pydantic_schemas.department import DepartmentCreate, DepartmentUpdate
+from pydantic_schemas.pagination import PageParams
 
 
-async def read_departments(db: AsyncSession) -> Sequence[Department]:
+async def read_departments(
+    db: AsyncSession,
+    page: PageParams,
+) -> dict:
     """
     Retrieve all departments from the database.
 
     Args:
         db (AsyncSession): An asynchronous database session.
+        page (PageParams): The cursor and limit of the page.
 
     Returns:
-        List[Department]: A sequence of Department objects representing all departments in the database.
+        dict: A page of Department objects in dept_id order and the next_cursor to continue from.
     """
     async with db.begin():
-        query = select(Department)
+        query = paginate(select(Department), Department.dept_id, page)
         result = await db.execute(query)
         departments = result.scalars().all()
-        return departments
+        return page_of(departments, Department.dept_id, page)
 
 
 async def add_department(db: AsyncSession, department: DepartmentCreate) -> Department:
@@ -52,6 +59,7 @@ async def add_department(db: AsyncSession, department: DepartmentCreate) -> Depa
         )
         db.add(new_dept)
         await db.commit()
+        await invalidate_reference("departments")
         return new_dept
 
 
@@ -101,6 +109,7 @@ async def patch_department(
             )
             await db.execute(query)
             await db.commit()
+            await invalidate_reference("departments", dept_id)
 
     # Read the updated department from the database
     new_dept = await read_department(db=db, dept_id=dept_id)
@@ -129,6 +138,7 @@ async def remove_department(db: AsyncSession, dept_id: int) -> Department:
         # Delete the department from the database
         await db.delete(department)
         await db.commit()
+        await invalidate_reference("departments", dept_id, deleted=True)
 
     return department
 
@@ -0,0 +1,79 @@
+import csv
+import io
+from typing import AsyncIterator
+
+from sqlalchemy import Select, and_, select
+from sqlalchemy.orm import sessionmaker
+
+from api.utils.marks import mark_filters
+from api.utils.projection import columns_of
+from api.utils.responses import dumps
+from api.utils.student_performances import student_performance_filters
+from db.models.mark import Mark
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+from pydantic_schemas.export import ExportParams
+from pydantic_schemas.mark import MarkQueryParams
+from pydantic_schemas.student_performance import StudentPerformanceQueryParams
+
+# rows fetched from the server-side cursor, and written to the response, at a time
+EXPORT_CHUNK_ROWS = 2000
+
+
+def _encode_ndjson(rows) -> bytes:
+    return b"".join(dumps(dict(row)) + b"\n" for row in rows)
+
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(row.values() for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_rows(
+    query: Select, export: ExportParams, session_factory: sessionmaker
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a query as NDJSON or CSV chunks.
+
+    The rows are read through a server-side cursor EXPORT_CHUNK_ROWS at a time and every
+    chunk is sent as soon as it is read, so memory use does not grow with the export.
+    The session is opened here since it has to outlive the request handler.
+    """
+    if export.format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(column.key for column in query.selected_columns)
+        yield buffer.getvalue().encode()
+
+    encode = _encode_csv if export.format == "csv" else _encode_ndjson
+    async with session_factory() as db:
+        async with db.begin():
+            result = await db.stream(
+                query.execution_options(yield_per=EXPORT_CHUNK_ROWS)
+            )
+            async for rows in result.mappings().partitions():
+                yield encode(rows)
+
+
+def export_marks_query(query_params: MarkQueryParams, export: ExportParams) -> Select:
+    filters = mark_filters(query_params)
+    if export.sem_id:
+        filters.append(
+            Mark.subject_id.in_(
+                select(Subject.subject_id).where(Subject.sem_id == export.sem_id)
+            )
+        )
+    return select(*columns_of(Mark, None)).where(and_(*filters)).order_by(Mark.mark_id)
+
+
+def export_student_performances_query(
+    query_params: StudentPerformanceQueryParams, export: ExportParams
+) -> Select:
+    filters = student_performance_filters(query_params)
+    if export.sem_id:
+        filters.append(StudentPerformance.sem_id == export.sem_id)
+    return (
+        select(*columns_of(StudentPerformance, None))
+        .where(and_(*filters))
+        .order_by(StudentPerformance.stud_perf_id)
+    )
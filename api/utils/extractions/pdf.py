@@ -0,0 +1,293 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from api.utils.cache import extraction_tags, shared_cache
+from api.utils.cgpa import recompute_cgpa
+from api.utils.rollups import refresh_subject_stats
+from db.models.mark import Mark
+from db.models.section import Section
+from db.models.student import Student
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+from pdfExtractor.pdfParser import isValid, parseContent
+from pydantic_schemas.extraction import ExtractionCreate
+from webExtractor.compute import SGPA
+
+from .scraper_utils import (
+    check_get_section,
+    check_get_semester,
+    compute_grade,
+    create_get_extraction,
+)
+
+# number of processes parsing the uploaded PDFs
+PARSE_WORKERS = os.cpu_count()
+
+# results that can be stored in marks.result
+MARK_RESULTS = {"P", "F", "A", "W"}
+
+# shared by every extraction, created once at startup by start_parse_pool
+parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_parse_pool():
+    """Create the process pool parsing the uploaded PDFs, called at startup."""
+    global parse_pool
+    if parse_pool is None:
+        # spawned rather than forked from the running server and its event loop
+        parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+
+
+def stop_parse_pool():
+    global parse_pool
+    if parse_pool is not None:
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        parse_pool = None
+
+
+async def read_uploads(uploads: List[UploadFile]):
+    """Yield (name, content) for every PDF of the uploads, zip members one at a time."""
+    for upload in uploads:
+        # the spooled upload files are read in the threadpool, off the event loop
+        if await run_in_threadpool(zipfile.is_zipfile, upload.file):
+            archive = await run_in_threadpool(zipfile.ZipFile, upload.file)
+            with archive:
+                for member in archive.infolist():
+                    if not member.is_dir() and member.filename.lower().endswith(".pdf"):
+                        yield member.filename, await run_in_threadpool(
+                            archive.read, member
+                        )
+        else:
+            await upload.seek(0)
+            yield upload.filename, await upload.read()
+
+
+async def parse_uploads(uploads: List[UploadFile]):
+    """Parse the uploaded PDFs in the process pool, submitting each one as it is read."""
+    start_parse_pool()
+    loop = asyncio.get_running_loop()
+    names = []
+    parsing = []
+    async for name, content in read_uploads(uploads):
+        names.append(name)
+        parsing.append(loop.run_in_executor(parse_pool, parseContent, content))
+    parsed = await asyncio.gather(*parsing, return_exceptions=True)
+    return list(zip(names, parsed))
+
+
+async def extract_section_pdfs(
+    section_id: int,
+    uploads: List[UploadFile],
+    session_factory: sessionmaker,
+):
+    start_time = time.time()
+
+    section = await check_get_section(section_id, session_factory)
+
+    semester = await check_get_semester(section.batch_id, session_factory)
+
+    async with session_factory() as db:
+        query = select(Subject.subject_id, Subject.sub_code, Subject.credits).where(
+            Subject.sem_id == semester.sem_id
+        )
+        result = await db.execute(query)
+        subjects = {subject.sub_code: subject for subject in result.all()}
+    if not subjects:
+        raise HTTPException(
+            status_code=404, detail="Subjects not found for the current semester"
+        )
+
+    parsed_files = await parse_uploads(uploads)
+    if not parsed_files:
+        raise HTTPException(status_code=400, detail="No PDF files uploaded")
+
+    invalid_files = []
+    unknown_subjects = set()
+    students = {}
+    for name, parsed in parsed_files:
+        # parseContent falls back to unvalidated parseTables rows, check them here
+        if isinstance(parsed, Exception) or not isValid(parsed):
+            invalid_files.append(name)
+            continue
+
+        (usn, stud_name), rows = parsed
+        marks = {}
+        for code, internal, external, total, result_code in rows:
+            if code not in subjects:
+                unknown_subjects.add(code)
+                continue
+            if result_code not in MARK_RESULTS:
+                continue
+            marks[code] = {
+                "subject_id": subjects[code].subject_id,
+                "credits": subjects[code].credits,
+                "internal": int(internal),
+                "external": int(external),
+                "total": int(total),
+                "result": result_code,
+                "grade": compute_grade(result_code, int(total)),
+            }
+
+        # students with no or one subject have likely dropped out
+        if len(marks) <= 1 or not usn:
+            invalid_files.append(name)
+            continue
+        students[usn.upper()] = (stud_name, list(marks.values()))
+
+    async with session_factory() as db:
+        async with db.begin():
+            if students:
+                stud_ids = await upsert_students(students, section, semester.sem_id, db)
+                await upsert_marks(students, stud_ids, section_id, db)
+                await upsert_student_performances(
+                    students, stud_ids, semester.sem_id, db
+                )
+                await recompute_cgpa(db, stud_ids=stud_ids.values())
+                await refresh_subject_stats(db, section_id)
+    await shared_cache.invalidate(
+        *extraction_tags(section.batch_id, section_id, semester.sem_id)
+    )
+
+    extraction = ExtractionCreate(
+        section_id=section_id,
+        sem_id=semester.sem_id,  # type: ignore
+        total_usns=len(parsed_files),
+        num_completed=len(parsed_files) - len(invalid_files),
+        num_invalid=len(invalid_files),
+        num_captcha=0,
+        num_timeout=0,
+        reattempts=0,
+        progress=100.0,
+        completed=True,
+        failed=False,
+        time_taken=round(time.time() - start_time, 2),
+    )
+    extraction_id = await create_get_extraction(extraction, session_factory)
+
+    return {
+        "message": "Extraction completed",
+        "extraction_id": extraction_id,
+        "number_files": len(parsed_files),
+        "number_students": len(students),
+        "invalid_files": invalid_files,
+        "unknown_subjects": sorted(unknown_subjects),
+    }
+
+
+async def upsert_students(
+    students: dict,
+    section: Section,
+    sem_id: int,
+    db: AsyncSession,
+) -> dict:
+    query = insert(Student).returning(Student.stud_id, Student.usn)
+    query = query.on_conflict_do_update(
+        index_elements=[Student.usn],
+        set_={
+            "stud_name": query.excluded.stud_name,
+            # students found in this section's results now study in it and this semester
+            "section_id": query.excluded.section_id,
+            "current_sem": query.excluded.current_sem,
+            "active": True,
+            "updated_at": func.now(),
+        },
+    )
+    result = await db.execute(
+        query,
+        [
+            {
+                "batch_id": section.batch_id,
+                "usn": usn,
+                "section_id": section.section_id,
+                "stud_name": stud_name,
+                "active": True,
+                "current_sem": sem_id,
+            }
+            for usn, (stud_name, _) in students.items()
+        ],
+    )
+    return {student.usn: student.stud_id for student in result.all()}
+
+
+async def upsert_marks(
+    students: dict,
+    stud_ids: dict,
+    section_id: int,
+    db: AsyncSession,
+):
+    query = insert(Mark)
+    query = query.on_conflict_do_update(
+        constraint="uq_marks_stud_subject_section",
+        set_={
+            "internal": query.excluded.internal,
+            "external": query.excluded.external,
+            "total": query.excluded.total,
+            "result": query.excluded.result,
+            "grade": query.excluded.grade,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(
+        query,
+        [
+            {
+                "stud_id": stud_ids[usn],
+                "subject_id": mark["subject_id"],
+                "section_id": section_id,
+                "internal": mark["internal"],
+                "external": mark["external"],
+                "total": mark["total"],
+                "result": mark["result"],
+                "grade": mark["grade"],
+            }
+            for usn, (_, marks) in students.items()
+            for mark in marks
+        ],
+    )
+
+
+async def upsert_student_performances(
+    students: dict,
+    stud_ids: dict,
+    sem_id: int,
+    db: AsyncSession,
+):
+    performances = []
+    for usn, (_, marks) in students.items():
+        totals = [mark["total"] for mark in marks]
+        credits = [mark["credits"] for mark in marks]
+        performances.append(
+            {
+                "stud_id": stud_ids[usn],
+                "sem_id": sem_id,
+                "total": sum(totals),
+                "percentage": round(sum(totals) / len(totals), 2),
+                "sgpa": round(SGPA(totals, credits), 1),
+            }
+        )
+
+    query = insert(StudentPerformance)
+    query = query.on_conflict_do_update(
+        constraint="uq_student_performances_stud_sem",
+        set_={
+            "total": query.excluded.total,
+            "percentage": query.excluded.percentage,
+            "sgpa": query.excluded.sgpa,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(query, performances)
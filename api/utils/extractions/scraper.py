@@ -7,6 +7,9 @@ from fastapi import BackgroundTasks, HTTPException
 from pydantic import HttpUrl
 from sqlalchemy.orm import sessionmaker
 
+from api.utils.cache import extraction_tags, shared_cache
+from api.utils.cgpa import recompute_cgpa
+from api.utils.rollups import refresh_subject_stats
 from pydantic_schemas.extraction import ExtractionCreate
 from pydantic_schemas.extraction_invalid import ExtractionInvalidCreate
 from pydantic_schemas.student import StudentUpdate
@@ -82,6 +85,7 @@ async def scrape_section(
             prefix_usn,
             usns,
             section_id,
+            section.batch_id,
             semester.sem_id,
             extraction_id,  # type: ignore
             invalid_id,  # type: ignore
@@ -105,6 +109,7 @@ async def scrape_and_store(
     prefix_usn: str,
     usns: List[int],
     section_id: int,
+    batch_id: int,
     sem_id: int,
     extraction_id: int,
     invalid_id: int,
@@ -120,6 +125,7 @@ async def scrape_and_store(
     invalid_usns = []
     captcha_usns = []
     timeout_usns = []
+    scraped_ids = []
 
     # Create a new session for this task
     async with session_factory() as db:
@@ -166,7 +172,10 @@ async def scrape_and_store(
                     invalids += 1
                     invalid_usns.append(usn)
                     student_new = await patch_student(
-                        db, student.stud_id, StudentUpdate(active=False)
+                        db,
+                        student.stud_id,
+                        StudentUpdate(active=False),
+                        invalidate=False,
                     )
                     print("Invalid student active:", student_new.active, flush=True)
                 elif status_code == 2:
@@ -186,9 +195,10 @@ async def scrape_and_store(
 
             # Update student data
             if student.stud_name != stud_name[1:]:  # type: ignore
-                await patch_student(db, student.stud_id, StudentUpdate(stud_name=stud_name[1:]))  # type: ignore
+                await patch_student(db, student.stud_id, StudentUpdate(stud_name=stud_name[1:]), invalidate=False)  # type: ignore
 
             await process_marks(marks, stud_id, section_id, session_factory)
+            scraped_ids.append(stud_id)
 
         print("Invalid usns: ", invalid_usns, flush=True)
 
@@ -212,6 +222,12 @@ async def scrape_and_store(
             db,
         )
 
+        # bring the section's rollups and the scraped students' CGPA up to date
+        async with db.begin():
+            await refresh_subject_stats(db, section_id)
+            await recompute_cgpa(db, stud_ids=scraped_ids)
+        await shared_cache.invalidate(*extraction_tags(batch_id, section_id, sem_id))
+
         driver.quit()  # type: ignore
         await asyncio.sleep(1)
         return True
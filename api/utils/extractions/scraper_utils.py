@@ -214,6 +214,23 @@ async def check_get_student(
     return student
 
 
+def compute_grade(
+    result_code: str,
+    total: int,
+) -> str:
+    if result_code == "P":
+        if total >= 75:
+            return "FCD"
+        elif total >= 60:
+            return "FC"
+        return "SC"
+    elif result_code == "F":
+        return "FAIL"
+    elif result_code == "A":
+        return "ABSENT"
+    return ""
+
+
 async def process_marks(
     marks: dict,
     stud_id: int,
@@ -229,18 +246,7 @@ async def process_marks(
             external = int(mark["EXT"])
             total = int(mark["TOT"])
             result_code = mark["Result"]
-            grade = ""
-            if result_code == "P":
-                if int(total) >= 75:
-                    grade = "FCD"
-                elif int(total) >= 60:
-                    grade = "FC"
-                else:
-                    grade = "SC"
-            elif result_code == "F":
-                grade = "FAIL"
-            elif result_code == "A":
-                grade = "ABSENT"
+            grade = compute_grade(result_code, total)
 
             subject_id = await check_get_subject_id(subject_code, db)
 
@@ -254,7 +260,8 @@ async def process_marks(
                     result=result_code,
                     grade=grade,
                 )
-                await patch_mark(db, mark_id.mark_id, update_mark)
+                # the section is refreshed and invalidated once, after the scrape
+                await patch_mark(db, mark_id.mark_id, update_mark, refresh=False)
 
             else:
                 new_mark = Mark(
@@ -7,6 +7,7 @@ from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import invalidate_reference
 from db.models.batch import Batch
 from db.models.semester import Semester
 from db.models.subject import Subject
@@ -143,6 +144,7 @@ async def add_subjects(
 
             db.add_all(new_subjects)
             await db.commit()
+            await invalidate_reference("subjects")
             return new_subjects
         except Exception as e:
             await db.rollback()
@@ -4,6 +4,7 @@ from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.pagination import page_of, paginate
 from db.models.extraction import Extraction
 from db.models.extraction_invalid import ExtractionInvalid
 from pydantic_schemas.extraction import (
@@ -15,12 +16,14 @@ from pydantic_schemas.extraction_invalid import (
     ExtractionInvalidCreate,
     ExtractionInvalidUpdate,
 )
+from pydantic_schemas.pagination import PageParams
 
 
 async def read_extractions(
     db: AsyncSession,
     query_params: ExtractionQueryParams,
-) -> Sequence[Extraction]:
+    page: PageParams,
+) -> dict:
     filters = []
     if query_params.section_id:
         filters.append(Extraction.section_id == query_params.section_id)
@@ -43,10 +46,12 @@ async def read_extractions(
     if query_params.time_taken:
         filters.append(Extraction.time_taken == query_params.time_taken)
     async with db.begin():
-        query = select(Extraction).where(and_(*filters))
+        query = paginate(
+            select(Extraction).where(and_(*filters)), Extraction.extraction_id, page
+        )
         result = await db.execute(query)
         extractions = result.scalars().all()
-        return extractions
+        return page_of(extractions, Extraction.extraction_id, page)
 
 
 async def add_extraction(db: AsyncSession, extraction: ExtractionCreate) -> Extraction:
@@ -1,17 +1,22 @@
-from typing import Sequence
+from typing import Iterable, List, Optional
 
 from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import scope_tags, semester_tags, shared_cache
+from api.utils.pagination import page_of, paginate
+from api.utils.projection import columns_of
+from api.utils.rollups import refresh_subject_stats
 from db.models.mark import Mark
+from db.models.section import Section
+from db.models.subject import Subject
 from pydantic_schemas.mark import MarkCreate, MarkQueryParams, MarkUpdate
+from pydantic_schemas.pagination import PageParams
 
 
-async def read_marks(
-    db: AsyncSession,
-    query_params: MarkQueryParams,
-) -> Sequence[Mark]:
+def mark_filters(query_params: MarkQueryParams) -> list:
+    """Build the filters of the marks matching the query parameters."""
     filters = []
     if query_params.stud_id:
         filters.append(Mark.stud_id == query_params.stud_id)
@@ -33,11 +38,48 @@ async def read_marks(
         filters.append(Mark.total >= query_params.min_total)
     if query_params.max_total:
         filters.append(Mark.total <= query_params.max_total)
+    return filters
+
+
+async def mark_tags(
+    db: AsyncSession, section_ids: Iterable[int], subject_ids: Iterable[int]
+) -> list:
+    """
+    Tags of the hot results computed from marks of the sections and subjects.
+
+    A mark is counted in results scoped to its section, to the section's batch and to
+    the subject's semester, so a write to it drops only those. Runs in the caller's
+    transaction.
+    """
+    query = select(Section.section_id, Section.batch_id).where(
+        Section.section_id.in_(set(section_ids))
+    )
+    sections = (await db.execute(query)).all()
+    query = select(Subject.sem_id).where(Subject.subject_id.in_(set(subject_ids)))
+    sem_ids = set((await db.execute(query)).scalars())
+
+    tags = []
+    for section_id, batch_id in sections:
+        tags.extend(scope_tags(section_id, batch_id))
+    tags.extend(semester_tags(sem_ids))
+    return tags
+
+
+async def read_marks(
+    db: AsyncSession,
+    query_params: MarkQueryParams,
+    page: PageParams,
+    fields: Optional[List[str]] = None,
+) -> dict:
+    filters = mark_filters(query_params)
     async with db.begin():
-        query = select(Mark).where(and_(*filters))
+        # rows are read as plain mappings, without building ORM objects, so they
+        # can be serialized straight away
+        columns = columns_of(Mark, fields)
+        query = paginate(select(*columns).where(and_(*filters)), Mark.mark_id, page)
         result = await db.execute(query)
-        marks = result.scalars().all()
-        return marks
+        marks = [dict(row) for row in result.mappings()]
+        return page_of(marks, Mark.mark_id, page)
 
 
 async def add_mark(db: AsyncSession, mark: MarkCreate) -> Mark:
@@ -53,19 +95,45 @@ async def add_mark(db: AsyncSession, mark: MarkCreate) -> Mark:
             grade=mark.grade,
         )  # type: ignore
         db.add(new_mark)
+        await db.flush()
+        await refresh_subject_stats(db, new_mark.section_id, [new_mark.subject_id])
+        tags = await mark_tags(db, [new_mark.section_id], [new_mark.subject_id])
         await db.commit()
+        await shared_cache.invalidate(*tags)
         return new_mark
 
 
-async def read_mark(db: AsyncSession, mark_id: int) -> Mark:
+async def read_mark(
+    db: AsyncSession, mark_id: int, fields: Optional[List[str]] = None
+) -> Mark:
     async with db.begin():
+        if fields:
+            query = select(*columns_of(Mark, fields)).filter(Mark.mark_id == mark_id)
+            result = await db.execute(query)
+            row = result.mappings().one_or_none()
+            return dict(row) if row else None
         query = select(Mark).filter(Mark.mark_id == mark_id)
         result = await db.execute(query)
         mark = result.scalar_one_or_none()
         return mark
 
 
-async def patch_mark(db: AsyncSession, mark_id: int, mark_data: MarkUpdate) -> Mark:
+async def patch_mark(
+    db: AsyncSession, mark_id: int, mark_data: MarkUpdate, refresh: bool = True
+) -> Mark:
+    """
+    Update a mark, then refresh the rollups and cached results it is counted in.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        mark_id (int): The ID of the mark.
+        mark_data (MarkUpdate): The fields to update.
+        refresh (bool): Refresh the rollups and drop the cached results. Extractions
+            patching many marks pass False and refresh the whole section once.
+
+    Returns:
+        Mark: The updated mark.
+    """
     async with db.begin():
         update_data = {}
         if mark_data.stud_id:
@@ -86,9 +154,32 @@ async def patch_mark(db: AsyncSession, mark_id: int, mark_data: MarkUpdate) -> M
             update_data["grade"] = mark_data.grade
 
         if update_data:
+            if refresh:
+                query = select(Mark.section_id, Mark.subject_id).where(
+                    Mark.mark_id == mark_id
+                )
+                old_mark = (await db.execute(query)).one()
             query = update(Mark).where(Mark.mark_id == mark_id).values(**update_data)
             await db.execute(query)
+
+            tags = []
+            if refresh:
+                # refresh the rollups the mark left and the one it is now counted in
+                section_id = update_data.get("section_id", old_mark.section_id)
+                subject_id = update_data.get("subject_id", old_mark.subject_id)
+                await refresh_subject_stats(db, section_id, [subject_id])
+                if (section_id, subject_id) != tuple(old_mark):
+                    await refresh_subject_stats(
+                        db, old_mark.section_id, [old_mark.subject_id]
+                    )
+                tags = await mark_tags(
+                    db,
+                    [section_id, old_mark.section_id],
+                    [subject_id, old_mark.subject_id],
+                )
             await db.commit()
+            if tags:
+                await shared_cache.invalidate(*tags)
 
     new_mark = await read_mark(db, mark_id)
     return new_mark
@@ -98,5 +189,9 @@ async def remove_mark(db: AsyncSession, mark_id: int) -> Mark:
     mark = await read_mark(db, mark_id)
     async with db.begin():
         await db.delete(mark)
+        await db.flush()
+        await refresh_subject_stats(db, mark.section_id, [mark.subject_id])
+        tags = await mark_tags(db, [mark.section_id], [mark.subject_id])
         await db.commit()
+        await shared_cache.invalidate(*tags)
     return mark
@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from pydantic_schemas.pagination import PageParams
+
+
+def paginate(query: Select, key: InstrumentedAttribute, page: PageParams) -> Select:
+    # keyset pagination: rows after the cursor in primary key order, so every page
+    # is an index range scan however deep it is, one extra row tells if more follow
+    if page.cursor is not None:
+        query = query.where(key > page.cursor)
+    return query.order_by(key).limit(page.limit + 1)
+
+
+def page_of(rows: Sequence, key: InstrumentedAttribute, page: PageParams) -> dict:
+    items = rows[: page.limit]
+    next_cursor = None
+    if len(rows) > page.limit:
+        last = items[-1]
+        # projected rows are plain dicts, full rows are ORM objects
+        next_cursor = (
+            last[key.key] if isinstance(last, dict) else getattr(last, key.key)
+        )
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,29 @@
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import inspect
+
+
+def columns_of(model, fields: Optional[List[str]]) -> list:
+    """
+    Map the requested fields of a model to its columns.
+
+    The primary key is always selected, so projected rows can still be paged and
+    identified. Every column is returned when no fields were requested.
+
+    Raises:
+        HTTPException: If a field is not a column of the model (status code 422).
+    """
+    mapper = inspect(model)
+    if not fields:
+        return [getattr(model, column.key) for column in mapper.columns]
+
+    unknown = [field for field in fields if field not in mapper.columns]
+    if unknown:
+        raise HTTPException(
+            status_code=422, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+
+    key = mapper.primary_key[0].key
+    names = list(dict.fromkeys([key, *fields]))
+    return [getattr(model, name) for name in names]
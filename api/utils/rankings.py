@@ -0,0 +1,120 @@
+from typing import List, Optional
+
+from sqlalchemy import and_, distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.utils.cache import cached_result, scope_tags
+from db.models.student import Student
+from db.models.student_performance import StudentPerformance
+from pydantic_schemas.ranking import RankingParams
+
+
+def ranking_filters(params: RankingParams) -> list:
+    """Build the filters of the performances ranked against each other."""
+    filters = [StudentPerformance.sem_id == params.sem_id]
+    if params.section_id:
+        filters.append(Student.section_id == params.section_id)
+    if params.batch_id:
+        filters.append(Student.batch_id == params.batch_id)
+    return filters
+
+
+def _ranking_tags(params: RankingParams, **_) -> list:
+    return scope_tags(params.section_id, params.batch_id, params.sem_id)
+
+
+@cached_result("rankings", _ranking_tags)
+async def read_rankings(
+    db: AsyncSession, params: RankingParams, top: int
+) -> List[dict]:
+    """
+    Rank the students of a section or batch in a semester.
+
+    The ranks are computed by the database with RANK() or DENSE_RANK() over the metric,
+    and only the students ranked within the top are returned, ties included.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        params (RankingParams): The semester, scope, metric and tie handling.
+        top (int): The lowest rank returned.
+
+    Returns:
+        List[dict]: The rank, student and performance of the top students.
+    """
+    metric = getattr(StudentPerformance, params.metric)
+    window = getattr(func, params.method)().over(order_by=metric.desc())
+    ranked = (
+        select(
+            window.label("rank"),
+            Student.stud_id,
+            Student.usn,
+            Student.stud_name,
+            Student.section_id,
+            StudentPerformance.total,
+            StudentPerformance.percentage,
+            StudentPerformance.sgpa,
+        )
+        .join(Student, Student.stud_id == StudentPerformance.stud_id)
+        .where(and_(*ranking_filters(params)))
+        .subquery()
+    )
+    query = (
+        select(ranked).where(ranked.c.rank <= top).order_by(ranked.c.rank, ranked.c.usn)
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+
+@cached_result("student-rank", _ranking_tags)
+async def read_student_rank(
+    db: AsyncSession, stud_id: int, params: RankingParams
+) -> Optional[dict]:
+    """
+    Find the rank of one student without ranking everyone.
+
+    The rank is one more than the number of performances (RANK) or distinct values
+    (DENSE_RANK) above the student's, counted over the metric index.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        stud_id (int): The ID of the student.
+        params (RankingParams): The semester, scope, metric and tie handling.
+
+    Returns:
+        dict: The rank, student and performance, or None if the student has no
+            performance in the scope.
+    """
+    metric = getattr(StudentPerformance, params.metric)
+    query = (
+        select(
+            Student.stud_id,
+            Student.usn,
+            Student.stud_name,
+            Student.section_id,
+            StudentPerformance.total,
+            StudentPerformance.percentage,
+            StudentPerformance.sgpa,
+        )
+        .join(Student, Student.stud_id == StudentPerformance.stud_id)
+        .where(and_(*ranking_filters(params), Student.stud_id == stud_id))
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        student = result.mappings().one_or_none()
+        if student is None:
+            return None
+
+        above = (
+            func.count(distinct(metric))
+            if params.method == "dense_rank"
+            else func.count()
+        )
+        query = (
+            select(above)
+            .select_from(StudentPerformance)
+            .join(Student, Student.stud_id == StudentPerformance.stud_id)
+            .where(and_(*ranking_filters(params), metric > student[params.metric]))
+        )
+        result = await db.execute(query)
+        return {"rank": result.scalar_one() + 1, **student}
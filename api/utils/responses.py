@@ -0,0 +1,23 @@
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _default(value):
+    # Numeric columns (cgpa, percentage, sgpa) are read as Decimal
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content) -> bytes:
+    """Encode plain database rows with orjson."""
+    return orjson.dumps(content, default=_default)
+
+
+class RowsResponse(ORJSONResponse):
+    """A JSON response of plain database rows, encoded by orjson without a model."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
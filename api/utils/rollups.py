@@ -0,0 +1,92 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models.mark import Mark
+from db.models.subject import Subject
+from db.models.subject_section_stat import SubjectSectionStat
+
+
+def _count(condition):
+    return func.count().filter(condition)
+
+
+def subject_stats_query(filters: list):
+    """Aggregate the marks matching the filters per section and subject."""
+    return (
+        select(
+            Mark.section_id,
+            Mark.subject_id,
+            Subject.sem_id,
+            func.count().label("students"),
+            _count(Mark.result == "P").label("passed"),
+            _count(Mark.result == "F").label("failed"),
+            _count(Mark.result == "A").label("absent"),
+            _count(Mark.result == "W").label("withheld"),
+            func.sum(Mark.internal).label("internal_sum"),
+            func.sum(Mark.external).label("external_sum"),
+            func.sum(Mark.total).label("total_sum"),
+            func.min(Mark.total).label("total_min"),
+            func.max(Mark.total).label("total_max"),
+            _count(Mark.grade == "FCD").label("fcd"),
+            _count(Mark.grade == "FC").label("fc"),
+            _count(Mark.grade == "SC").label("sc"),
+            _count(Mark.grade == "FAIL").label("fail"),
+            _count(Mark.grade == "ABSENT").label("grade_absent"),
+        )
+        .join(Subject, Subject.subject_id == Mark.subject_id)
+        .where(and_(*filters))
+        .group_by(Mark.section_id, Mark.subject_id, Subject.sem_id)
+    )
+
+
+async def refresh_subject_stats(
+    db: AsyncSession, section_id: int, subject_ids: Optional[Iterable[int]] = None
+):
+    """
+    Recompute the subject rollups of a section from its marks.
+
+    Only the given subjects, or every subject of the section, are aggregated again, so
+    a refresh reads the marks of one section through the (section_id, subject_id)
+    index. Runs in the caller's transaction.
+
+    Args:
+        db (AsyncSession): An asynchronous database session, in a transaction.
+        section_id (int): The section whose rollups are refreshed.
+        subject_ids (Iterable[int], optional): The subjects to refresh, all by default.
+    """
+    mark_filters = [Mark.section_id == section_id]
+    stat_filters = [SubjectSectionStat.section_id == section_id]
+    if subject_ids is not None:
+        subject_ids = list(subject_ids)
+        mark_filters.append(Mark.subject_id.in_(subject_ids))
+        stat_filters.append(SubjectSectionStat.subject_id.in_(subject_ids))
+
+    stats = subject_stats_query(mark_filters)
+    columns = [column.key for column in stats.selected_columns]
+    query = insert(SubjectSectionStat).from_select(columns, stats)
+    query = query.on_conflict_do_update(
+        index_elements=[SubjectSectionStat.section_id, SubjectSectionStat.subject_id],
+        set_={
+            **{column: query.excluded[column] for column in columns[2:]},
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(query)
+
+    # drop the rollups of subjects that have no marks left in the section
+    await db.execute(
+        delete(SubjectSectionStat).where(
+            and_(
+                *stat_filters,
+                ~exists().where(
+                    and_(
+                        Mark.section_id == SubjectSectionStat.section_id,
+                        Mark.subject_id == SubjectSectionStat.subject_id,
+                    )
+                ),
+            )
+        )
+    )
@@ -1,17 +1,30 @@
-from typing import Sequence
+from typing import Optional
 
-from sqlalchemy import and_, update
+from sqlalchemy import and_, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import (
+    cached_query,
+    invalidate_reference,
+    reference_tags,
+    scope_tags,
+)
+from api.utils.pagination import page_of, paginate
+from db.models.mark import Mark
 from db.models.section import Section
+from db.models.student import Student
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+from pydantic_schemas.pagination import PageParams
 from pydantic_schemas.section import SectionCreate, SectionQueryParams, SectionUpdate
 
 
 async def read_sections(
     db: AsyncSession,
     query_params: SectionQueryParams,
-) -> Sequence[Section]:
+    page: PageParams,
+) -> dict:
     filters = []
     if query_params.batch_id:
         filters.append(Section.batch_id == query_params.batch_id)
@@ -24,10 +37,12 @@ async def read_sections(
     if query_params.max_students:
         filters.append(Section.num_students <= query_params.max_students)
     async with db.begin():
-        query = select(Section).where(and_(*filters))
+        query = paginate(
+            select(Section).where(and_(*filters)), Section.section_id, page
+        )
         result = await db.execute(query)
         sections = result.scalars().all()
-        return sections
+        return page_of(sections, Section.section_id, page)
 
 
 async def add_section(db: AsyncSession, section: SectionCreate) -> Section:
@@ -43,6 +58,7 @@ async def add_section(db: AsyncSession, section: SectionCreate) -> Section:
         )
         db.add(new_section)
         await db.commit()
+        await invalidate_reference("sections")
         return new_section
 
 
@@ -82,6 +98,7 @@ async def patch_section(
             )
             await db.execute(query)
             await db.commit()
+            await invalidate_reference("sections", section_id)
 
     new_section = await read_section(db, section_id)
     return new_section
@@ -92,4 +109,94 @@ async def remove_section(db: AsyncSession, section_id: int) -> Section:
     async with db.begin():
         await db.delete(section)
         await db.commit()
+        await invalidate_reference("sections", section_id, deleted=True)
     return section
+
+
+async def read_result_sheet(
+    db: AsyncSession, section_id: int, sem_id: int
+) -> Optional[dict]:
+    """
+    Build the result sheet of a section for a semester in a single query.
+
+    Every student of the section gets one row holding its marks of the semester keyed
+    by subject code, next to its total, percentage and SGPA. The marks are gathered with
+    json_object_agg, so the pivot is done by the database whatever the subjects are.
+    Whether the section exists is cached along with the sheet, so a cache hit makes no
+    query at all.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        section_id (int): The ID of the section.
+        sem_id (int): The ID of the semester.
+
+    Returns:
+        dict: The subject codes and the row of every student, in USN order, or None if
+            the section does not exist.
+    """
+    marks = func.json_object_agg(
+        Subject.sub_code,
+        func.json_build_object(
+            "internal",
+            Mark.internal,
+            "external",
+            Mark.external,
+            "total",
+            Mark.total,
+            "result",
+            Mark.result,
+        ),
+    )
+    query = (
+        select(
+            Student.stud_id,
+            Student.usn,
+            Student.stud_name,
+            marks.label("marks"),
+            StudentPerformance.total,
+            StudentPerformance.percentage,
+            StudentPerformance.sgpa,
+        )
+        .join(Student, Student.stud_id == Mark.stud_id)
+        .join(
+            Subject,
+            and_(Subject.subject_id == Mark.subject_id, Subject.sem_id == sem_id),
+        )
+        .outerjoin(
+            StudentPerformance,
+            and_(
+                StudentPerformance.stud_id == Student.stud_id,
+                StudentPerformance.sem_id == sem_id,
+            ),
+        )
+        .where(Mark.section_id == section_id)
+        .group_by(Student.stud_id, StudentPerformance.stud_perf_id)
+        .order_by(Student.usn)
+        .select_from(Mark)
+    )
+
+    async def load():
+        async with db.begin():
+            exists = select(Section.section_id).where(Section.section_id == section_id)
+            if (await db.execute(exists)).scalar_one_or_none() is None:
+                return None
+            result = await db.execute(query)
+            students = [dict(row) for row in result.mappings()]
+
+        subjects = sorted({code for student in students for code in student["marks"]})
+        return {
+            "section_id": section_id,
+            "sem_id": sem_id,
+            "subjects": subjects,
+            "students": students,
+        }
+
+    # a missing section is remembered until a section is added
+    def tags(sheet: Optional[dict]) -> list:
+        sheet_tags = scope_tags(section_id, sem_id=sem_id)
+        if sheet is None:
+            sheet_tags.extend(reference_tags("sections"))
+        return sheet_tags
+
+    key = ("result-sheet", section_id, sem_id)
+    return await cached_query(key, tags, load)
@@ -1,10 +1,11 @@
-from typing import Sequence
-
 from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import invalidate_reference
+from api.utils.pagination import page_of, paginate
 from db.models.semester import Semester
+from pydantic_schemas.pagination import PageParams
 from pydantic_schemas.semester import (
     SemesterCreate,
     SemesterQueryParams,
@@ -15,15 +16,17 @@ from pydantic_schemas.semester import (
 async def read_semesters(
     db: AsyncSession,
     query_params: SemesterQueryParams,
-) -> Sequence[Semester]:
+    page: PageParams,
+) -> dict:
     """
     Reads all semesters from the database.
 
     Args:
         db (AsyncSession): The async database session.
+        page (PageParams): The cursor and limit of the page.
 
     Returns:
-        Sequence[Semester]: A sequence of Semester objects.
+        dict: A page of Semester objects in sem_id order and the next_cursor to continue from.
     """
     filters = []
     if query_params.batch_id:
@@ -37,10 +40,10 @@ async def read_semesters(
     if query_params.max_subjects:
         filters.append(Semester.num_subjects <= query_params.max_subjects)
     async with db.begin():
-        query = select(Semester).where(and_(*filters))
+        query = paginate(select(Semester).where(and_(*filters)), Semester.sem_id, page)
         result = await db.execute(query)
         semesters = result.scalars().all()
-        return semesters
+        return page_of(semesters, Semester.sem_id, page)
 
 
 async def add_semester(db: AsyncSession, semester: SemesterCreate) -> Semester:
@@ -63,6 +66,7 @@ async def add_semester(db: AsyncSession, semester: SemesterCreate) -> Semester:
         )
         db.add(new_semester)
         await db.commit()
+        await invalidate_reference("semesters")
         return new_semester
 
 
@@ -97,6 +101,7 @@ async def patch_semester(
             )
             await db.execute(query)
             await db.commit()
+            await invalidate_reference("semesters", sem_id)
     new_semester = await read_semester(db=db, sem_id=sem_id)
     return new_semester
 
@@ -134,4 +139,5 @@ async def remove_semester(db: AsyncSession, sem_id: int) -> Semester:
     async with db.begin():
         await db.delete(semester)
         await db.commit()
+        await invalidate_reference("semesters", sem_id, deleted=True)
         return semester
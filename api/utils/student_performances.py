@@ -1,10 +1,13 @@
-from typing import Sequence
-
 from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import semester_tags, shared_cache
+from api.utils.cgpa import recompute_cgpa
+from api.utils.pagination import page_of, paginate
+from api.utils.projection import columns_of
 from db.models.student_performance import StudentPerformance
+from pydantic_schemas.pagination import PageParams
 from pydantic_schemas.student_performance import (
     StudentPerformanceCreate,
     StudentPerformanceQueryParams,
@@ -12,10 +15,8 @@ from pydantic_schemas.student_performance import (
 )
 
 
-async def read_student_performances(
-    db: AsyncSession,
-    query_params: StudentPerformanceQueryParams,
-) -> Sequence[StudentPerformance]:
+def student_performance_filters(query_params: StudentPerformanceQueryParams) -> list:
+    """Build the filters of the student performances matching the query parameters."""
     filters = []
     if query_params.stud_id:
         filters.append(StudentPerformance.stud_id == query_params.stud_id)
@@ -39,11 +40,27 @@ async def read_student_performances(
         filters.append(StudentPerformance.sgpa >= query_params.min_sgpa)
     if query_params.max_sgpa:
         filters.append(StudentPerformance.sgpa <= query_params.max_sgpa)
+    return filters
+
+
+async def read_student_performances(
+    db: AsyncSession,
+    query_params: StudentPerformanceQueryParams,
+    page: PageParams,
+) -> dict:
+    filters = student_performance_filters(query_params)
     async with db.begin():
-        query = select(StudentPerformance).where(and_(*filters))
+        # rows are read as plain mappings, without building ORM objects, so they
+        # can be serialized straight away
+        columns = columns_of(StudentPerformance, None)
+        query = paginate(
+            select(*columns).where(and_(*filters)),
+            StudentPerformance.stud_perf_id,
+            page,
+        )
         result = await db.execute(query)
-        student_performances = result.scalars().all()
-        return student_performances
+        student_performances = [dict(row) for row in result.mappings()]
+        return page_of(student_performances, StudentPerformance.stud_perf_id, page)
 
 
 async def add_student_performance(
@@ -58,7 +75,9 @@ async def add_student_performance(
             sgpa=student_performance.sgpa,
         )
         db.add(new_student_performance)
+        await recompute_cgpa(db, stud_ids=[student_performance.stud_id])
         await db.commit()
+        await shared_cache.invalidate(*semester_tags([student_performance.sem_id]))
         return new_student_performance
 
 
@@ -97,9 +116,21 @@ async def patch_student_performance(
             update(StudentPerformance)
             .where(StudentPerformance.stud_perf_id == student_performance_id)
             .values(**update_data)
+            .returning(StudentPerformance.stud_id, StudentPerformance.sem_id)
         )
-        await db.execute(query)
+        old = (
+            await db.execute(
+                select(StudentPerformance.stud_id, StudentPerformance.sem_id).where(
+                    StudentPerformance.stud_perf_id == student_performance_id
+                )
+            )
+        ).one_or_none()
+        new = (await db.execute(query)).one_or_none()
+        # the performance may have moved to another student or semester
+        moved = [row for row in (old, new) if row is not None]
+        await recompute_cgpa(db, stud_ids={row.stud_id for row in moved})
         await db.commit()
+        await shared_cache.invalidate(*semester_tags({row.sem_id for row in moved}))
 
     new_student_performance = await read_student_performance(db, student_performance_id)
     return new_student_performance
@@ -111,5 +142,8 @@ async def remove_student_performance(
     student_performance = await read_student_performance(db, student_performance_id)
     async with db.begin():
         await db.delete(student_performance)
+        await db.flush()
+        await recompute_cgpa(db, stud_ids=[student_performance.stud_id])
         await db.commit()
+        await shared_cache.invalidate(*semester_tags([student_performance.sem_id]))
         return student_performance
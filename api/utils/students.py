@@ -1,17 +1,32 @@
-from typing import Sequence
+from typing import List, Optional
 
-from sqlalchemy import and_, update
+from sqlalchemy import and_, case, func, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
 
+from api.utils.cache import scope_tags, semester_tags, shared_cache
+from api.utils.pagination import page_of, paginate
+from api.utils.projection import columns_of
+from db.models.mark import Mark
 from db.models.student import Student
-from pydantic_schemas.student import StudentCreate, StudentQueryParams, StudentUpdate
+from db.models.student_performance import StudentPerformance
+from db.models.subject import Subject
+from pydantic_schemas.pagination import PageParams
+from pydantic_schemas.student import (
+    StudentCreate,
+    StudentQueryParams,
+    StudentSearchParams,
+    StudentUpdate,
+)
 
 
 async def read_students(
     db: AsyncSession,
     query_params: StudentQueryParams,
-) -> Sequence[Student]:
+    page: PageParams,
+    fields: Optional[List[str]] = None,
+) -> dict:
     filters = []
     if query_params.batch_id:
         filters.append(Student.batch_id == query_params.batch_id)
@@ -32,14 +47,26 @@ async def read_students(
     if query_params.stud_name:
         filters.append(Student.stud_name == query_params.stud_name)
     async with db.begin():
-        query = select(Student).where(and_(*filters))
+        # rows are read as plain mappings, without building ORM objects, so they
+        # can be serialized straight away
+        columns = columns_of(Student, fields)
+        query = paginate(select(*columns).where(and_(*filters)), Student.stud_id, page)
         result = await db.execute(query)
-        students = result.scalars().all()
-        return students
+        students = [dict(row) for row in result.mappings()]
+        return page_of(students, Student.stud_id, page)
 
 
-async def read_student(db: AsyncSession, student_id: int) -> Student:
+async def read_student(
+    db: AsyncSession, student_id: int, fields: Optional[List[str]] = None
+) -> Student:
     async with db.begin():
+        if fields:
+            query = select(*columns_of(Student, fields)).filter(
+                Student.stud_id == student_id
+            )
+            result = await db.execute(query)
+            row = result.mappings().one_or_none()
+            return dict(row) if row else None
         query = select(Student).filter(Student.stud_id == student_id)
         result = await db.execute(query)
         student = result.scalar_one_or_none()
@@ -62,9 +89,44 @@ async def add_student(db: AsyncSession, student: StudentCreate) -> Student:
         return new_student
 
 
+async def student_tags(db: AsyncSession, student_id: int) -> list:
+    """
+    Tags of the hot results a student is counted in: the student's section, batch and
+    the semesters it has a performance in. Runs in the caller's transaction.
+    """
+    query = select(Student.section_id, Student.batch_id).where(
+        Student.stud_id == student_id
+    )
+    student = (await db.execute(query)).one_or_none()
+    if student is None:
+        return []
+    query = select(StudentPerformance.sem_id).where(
+        StudentPerformance.stud_id == student_id
+    )
+    sem_ids = (await db.execute(query)).scalars().all()
+    return [*scope_tags(student.section_id, student.batch_id), *semester_tags(sem_ids)]
+
+
 async def patch_student(
-    db: AsyncSession, student_id: int, student_data: StudentUpdate
+    db: AsyncSession,
+    student_id: int,
+    student_data: StudentUpdate,
+    invalidate: bool = True,
 ) -> Student:
+    """
+    Update a student, then drop the cached results it is counted in.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        student_id (int): The ID of the student.
+        student_data (StudentUpdate): The fields to update.
+        invalidate (bool): Drop the cached results of the student's old and new
+            section, batch and semesters. Extractions pass False and invalidate the
+            whole section once.
+
+    Returns:
+        Student: The updated student.
+    """
     async with db.begin():
         update_data = {}
         if student_data.batch_id:
@@ -83,13 +145,19 @@ async def patch_student(
             update_data["current_sem"] = student_data.current_sem
 
         if update_data:
+            # the results of the section and batch the student leaves are stale too
+            tags = await student_tags(db, student_id) if invalidate else []
             query = (
                 update(Student)
                 .where(Student.stud_id == student_id)
                 .values(**update_data)
             )
             await db.execute(query)
+            if invalidate:
+                tags.extend(await student_tags(db, student_id))
             await db.commit()
+            if tags:
+                await shared_cache.invalidate(*set(tags))
 
     new_student = await read_student(db, student_id)
     return new_student
@@ -98,6 +166,134 @@ async def patch_student(
 async def remove_student(db: AsyncSession, student_id: int) -> Student:
     student = await read_student(db, student_id)
     async with db.begin():
+        tags = await student_tags(db, student_id)
         await db.delete(student)
         await db.commit()
+        await shared_cache.invalidate(*tags)
     return student
+
+
+async def read_student_profile(db: AsyncSession, student_id: int) -> Optional[dict]:
+    """
+    Retrieve a student with the performance and marks of every semester.
+
+    The performances and the marks, with their subjects and semesters joined in, are
+    loaded with one selectin query each, so a profile takes three statements however
+    many semesters the student has.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        student_id (int): The ID of the student.
+
+    Returns:
+        dict: The student and its semesters in order, or None if it does not exist.
+    """
+    query = (
+        select(Student)
+        .where(Student.stud_id == student_id)
+        .options(
+            selectinload(Student.student_performances).joinedload(
+                StudentPerformance.semester
+            ),
+            selectinload(Student.marks)
+            .joinedload(Mark.subject)
+            .joinedload(Subject.semester),
+        )
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        student = result.scalar_one_or_none()
+    if student is None:
+        return None
+
+    semesters = {}
+    for mark in sorted(student.marks, key=lambda mark: mark.subject.sub_code):
+        semester = mark.subject.semester
+        semesters.setdefault(
+            semester.sem_id,
+            {"sem_id": semester.sem_id, "sem_num": semester.sem_num, "marks": []},
+        )
+        semesters[semester.sem_id]["marks"].append(
+            {
+                "subject_id": mark.subject_id,
+                "sub_code": mark.subject.sub_code,
+                "sub_name": mark.subject.sub_name,
+                "credits": mark.subject.credits,
+                "internal": mark.internal,
+                "external": mark.external,
+                "total": mark.total,
+                "result": mark.result,
+                "grade": mark.grade,
+            }
+        )
+    for performance in student.student_performances:
+        semester = performance.semester
+        semesters.setdefault(
+            semester.sem_id,
+            {"sem_id": semester.sem_id, "sem_num": semester.sem_num, "marks": []},
+        )
+        semesters[semester.sem_id].update(
+            total=performance.total,
+            percentage=performance.percentage,
+            sgpa=performance.sgpa,
+        )
+
+    return {
+        **{
+            column.key: getattr(student, column.key)
+            for column in columns_of(Student, None)
+        },
+        "semesters": sorted(semesters.values(), key=lambda sem: sem["sem_num"]),
+    }
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_students(db: AsyncSession, params: StudentSearchParams) -> List[dict]:
+    """
+    Search students by USN prefix, partial name or misspelt name.
+
+    USN prefixes are served by the varchar_pattern_ops index on usn and names by the
+    trigram index on stud_name. USN matches are ranked first, then names by their
+    trigram similarity to the search.
+
+    Args:
+        db (AsyncSession): An asynchronous database session.
+        params (StudentSearchParams): The search, scope and number of results.
+
+    Returns:
+        List[dict]: The best matching students with their score.
+    """
+    term = params.q
+    usn_match = Student.usn.like(f"{_escape_like(term.upper())}%", escape="\\")
+    name_match = or_(
+        Student.stud_name.ilike(f"%{_escape_like(term)}%", escape="\\"),
+        # pg_trgm similarity operator, tolerates typos
+        Student.stud_name.op("%")(term),
+    )
+    score = case((usn_match, 1.0), else_=0.0) + func.similarity(Student.stud_name, term)
+
+    filters = [or_(usn_match, name_match)]
+    if params.batch_id:
+        filters.append(Student.batch_id == params.batch_id)
+    if params.section_id:
+        filters.append(Student.section_id == params.section_id)
+
+    query = (
+        select(
+            Student.stud_id,
+            Student.usn,
+            Student.stud_name,
+            Student.batch_id,
+            Student.section_id,
+            score.label("score"),
+        )
+        .where(and_(*filters))
+        .order_by(score.desc(), Student.usn)
+        .limit(params.limit)
+    )
+    async with db.begin():
+        result = await db.execute(query)
+        return [dict(row) for row in result.mappings()]
@@ -1,17 +1,19 @@
-from typing import Sequence
-
 from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from api.utils.cache import invalidate_reference
+from api.utils.pagination import page_of, paginate
 from db.models.subject import Subject
+from pydantic_schemas.pagination import PageParams
 from pydantic_schemas.subject import SubjectCreate, SubjectQueryParams, SubjectUpdate
 
 
 async def read_subjects(
     db: AsyncSession,
     query_params: SubjectQueryParams,
-) -> Sequence[Subject]:
+    page: PageParams,
+) -> dict:
     filters = []
     if query_params.sub_code:
         filters.append(Subject.sub_code == query_params.sub_code)
@@ -20,10 +22,12 @@ async def read_subjects(
     if query_params.sub_name:
         filters.append(Subject.sub_name == query_params.sub_name)
     async with db.begin():
-        query = select(Subject).where(and_(*filters))
+        query = paginate(
+            select(Subject).where(and_(*filters)), Subject.subject_id, page
+        )
         result = await db.execute(query)
         subjects = result.scalars().all()
-        return subjects
+        return page_of(subjects, Subject.subject_id, page)
 
 
 async def read_subject(db: AsyncSession, subject_id: int) -> Subject:
@@ -44,6 +48,7 @@ async def add_subject(db: AsyncSession, subject: SubjectCreate) -> Subject:
         )
         db.add(new_subject)
         await db.commit()
+        await invalidate_reference("subjects")
         return new_subject
 
 
@@ -69,6 +74,7 @@ async def patch_subject(
             )
             await db.execute(query)
             await db.commit()
+            await invalidate_reference("subjects", subject_id)
 
     new_subject = await read_subject(db, subject_id)
     return new_subject
@@ -79,4 +85,5 @@ async def remove_subject(db: AsyncSession, subject_id: int) -> Subject:
     async with db.begin():
         await db.delete(subject)
         await db.commit()
+        await invalidate_reference("subjects", subject_id, deleted=True)
     return subject
@@ -0,0 +1,200 @@
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# number of jobs run at the same time by `jobs`
+JOB_WORKERS = 2
+
+
+def run_job(job):
+    """
+    Generate and publish the results of one job, without prompting.
+
+    Parameters:
+        job (dict): The job settings. "type" is "scrape" (with "prefix", "start", "end" and
+            optionally "result_url", "workers" and "credits") or "pdf" (with "location",
+            "credits" and optionally "cache"). Both accept "report" ("sheets", "xlsx" or "parquet"),
+            "output" (required for xlsx and parquet), "title" (required for sheets) and "email".
+
+    Returns:
+        dict: The name, status, number of students, time taken and report location of the job.
+    """
+    # imported here so every job process loads the extractors itself
+    from pdfExtractor import preprocessing as pdf_preprocessing
+    from webExtractor import generateResult, preprocessing, reportSinks
+
+    name = job.get("name") or job.get("location") or job.get("prefix")
+    job_type = job.get("type")
+    summary = {"name": name, "type": str(job_type), "students": 0, "output": ""}
+    start_time = time.perf_counter()
+
+    try:
+        if job_type not in ("scrape", "pdf"):
+            raise ValueError(f"Unknown job type: {job_type}")
+        # the PDF parser prompts for missing credits, which a job must never reach
+        if job_type == "pdf" and not job.get("credits"):
+            raise ValueError('pdf jobs need the "credits" of every subject')
+
+        sink = reportSinks.makeSink(
+            job.get("report", "xlsx"), job.get("output"), job.get("title")
+        )
+
+        if job_type == "scrape":
+            students_marks = generateResult.scrape_usn_range(
+                int(job["start"]),
+                int(job["end"]),
+                job["prefix"],
+                int(job.get("workers", 1)),
+                job.get("result_url", preprocessing.RESULT_URL),
+                job.get("credits"),
+            )
+        else:
+            students_marks = pdf_preprocessing.processResult(
+                job["location"], job["credits"], job.get("cache")
+            )
+
+        if students_marks is None or students_marks.empty:
+            raise ValueError("No results were extracted")
+
+        summary["students"] = len(students_marks)
+        location = sink.write(*reportSinks.reportFrames(students_marks))
+        summary["output"] = location
+
+        # Only a spreadsheet link can be shared through mail
+        if job.get("email") and isinstance(sink, reportSinks.SheetsSink):
+            generateResult.send_email(job["email"], location)
+
+        summary["status"] = "done"
+    except Exception as e:
+        summary["status"] = f"failed: {e}"
+
+    summary["seconds"] = time.perf_counter() - start_time
+    return summary
+
+
+def run_jobs(jobs, job_workers=JOB_WORKERS):
+    """
+    Run many jobs in a pool of processes and print a timing summary.
+
+    Parameters:
+        jobs (list): The settings of every job, as accepted by `run_job`.
+        job_workers (int): The number of jobs run at the same time.
+
+    Returns:
+        list: The summary of every job, in the order they were given.
+    """
+    start_time = time.perf_counter()
+
+    if job_workers <= 1 or len(jobs) == 1:
+        summaries = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=job_workers) as pool:
+            futures = {pool.submit(run_job, job): i for i, job in enumerate(jobs)}
+            summaries = [None] * len(jobs)
+            for future in as_completed(futures):
+                summaries[futures[future]] = future.result()
+
+    print_summary(summaries, time.perf_counter() - start_time)
+    return summaries
+
+
+def print_summary(summaries, total_time):
+    """Print the name, type, status, number of students and time taken of every job."""
+    print()
+    print(f"{'Job':<30} {'Type':<7} {'Students':>8} {'Seconds':>9}  Status")
+    for summary in summaries:
+        print(
+            f"{str(summary['name'])[:30]:<30} {summary['type']:<7} "
+            f"{summary['students']:>8} {summary['seconds']:>9.2f}  {summary['status']}"
+        )
+        if summary["output"]:
+            print(f"{'':<30} -> {summary['output']}")
+    print(f"{len(summaries)} job(s) in {total_time:.2f} seconds")
+
+
+def add_report_arguments(parser, credits_required=False):
+    """Add the arguments shared by the single job commands."""
+    parser.add_argument(
+        "--credits",
+        type=int,
+        nargs="+",
+        required=credits_required,
+        help="credits of every subject, in the order the subjects appear in the results",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["sheets", "xlsx", "parquet"],
+        default="xlsx",
+        help="where the report is published (default: xlsx)",
+    )
+    parser.add_argument(
+        "--output", help="XLSX file or Parquet folder path of local reports"
+    )
+    parser.add_argument(
+        "--title", help="title of the Google Sheets spreadsheet (required for sheets)"
+    )
+    parser.add_argument(
+        "--email", help="send the spreadsheet link to this address (sheets only)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate VTU result reports without prompting, from the results "
+        "website or from result PDFs."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scrape = commands.add_parser("scrape", help="scrape a USN range")
+    scrape.add_argument("--prefix", required=True, help="USN prefix, e.g. 1AB21CS")
+    scrape.add_argument("--start", type=int, required=True, help="first USN number")
+    scrape.add_argument("--end", type=int, required=True, help="last USN number")
+    scrape.add_argument("--result-url", help="VTU results page to scrape")
+    scrape.add_argument(
+        "--workers", type=int, default=1, help="number of WebDrivers (default: 1)"
+    )
+    add_report_arguments(scrape)
+
+    pdf = commands.add_parser("pdf", help="parse a folder or archive of result PDFs")
+    pdf.add_argument(
+        "location", help="Google Drive folder link, local folder or zip archive"
+    )
+    pdf.add_argument(
+        "--cache",
+        help="parse cache file (default: $PDF_PARSE_CACHE or pdfExtractor/parse_cache.json)",
+    )
+    add_report_arguments(pdf, credits_required=True)
+
+    jobs = commands.add_parser("jobs", help="run every job of a JSON job file")
+    jobs.add_argument(
+        "job_file", help="JSON file holding a list of scrape and pdf jobs"
+    )
+    jobs.add_argument(
+        "--job-workers",
+        type=int,
+        default=JOB_WORKERS,
+        help=f"number of jobs run at the same time (default: {JOB_WORKERS})",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "jobs":
+        with open(args.job_file) as job_file:
+            job_list = json.load(job_file)
+        summaries = run_jobs(job_list, args.job_workers)
+    else:
+        job = {
+            key: value
+            for key, value in vars(args).items()
+            if value is not None and key != "command"
+        }
+        job["type"] = args.command
+        summaries = run_jobs([job], 1)
+
+    # exit with an error when any job failed, for schedulers
+    return 0 if all(summary["status"] == "done" for summary in summaries) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
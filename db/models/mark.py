@@ -1,4 +1,12 @@
-from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, String
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from ..db_setup import Base
@@ -29,6 +37,14 @@ class Mark(Timestamp, Base):
         CheckConstraint("internal <= 50", name="check_internal"),
         CheckConstraint("external <= 50", name="check_external"),
         CheckConstraint("total <= 100", name="check_total"),
+        # one mark per student and subject, the target of the extraction upserts
+        UniqueConstraint(
+            "stud_id", "subject_id", "section_id", name="uq_marks_stud_subject_section"
+        ),
+        # marks of a section, by subject, read by the section result sheet
+        Index("ix_marks_section_subject", "section_id", "subject_id"),
+        # grades of a subject, counted by the grade distribution analytics
+        Index("ix_marks_subject_grade", "subject_id", "grade"),
     )
 
     mark_id = Column(Integer, primary_key=True, index=True)
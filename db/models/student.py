@@ -3,6 +3,7 @@ from sqlalchemy import (
     CheckConstraint,
     Column,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -34,6 +35,21 @@ class Student(Timestamp, Base):
     """
 
     __tablename__ = "students"
+    __table_args__ = (
+        # USN prefix searches (LIKE '1AB21CS%') whatever the database collation
+        Index(
+            "ix_students_usn_prefix",
+            "usn",
+            postgresql_ops={"usn": "varchar_pattern_ops"},
+        ),
+        # partial and typo tolerant name searches, needs the pg_trgm extension
+        Index(
+            "ix_students_stud_name_trgm",
+            "stud_name",
+            postgresql_using="gin",
+            postgresql_ops={"stud_name": "gin_trgm_ops"},
+        ),
+    )
 
     stud_id = Column(Integer, primary_key=True, index=True)
     batch_id = Column(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, ForeignKey, Integer, Numeric, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from ..db_setup import Base
@@ -7,6 +7,10 @@ from .mixins import Timestamp
 
 class StudentPerformance(Timestamp, Base):
     __tablename__ = "student_performances"
+    # one performance per student and semester, the target of the extraction upserts
+    __table_args__ = (
+        UniqueConstraint("stud_id", "sem_id", name="uq_student_performances_stud_sem"),
+    )
 
     stud_perf_id = Column(Integer, primary_key=True, index=True)
     stud_id = Column(
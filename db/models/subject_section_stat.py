@@ -0,0 +1,62 @@
+from sqlalchemy import Column, ForeignKey, Integer
+
+from ..db_setup import Base
+from .mixins import Timestamp
+
+
+class SubjectSectionStat(Timestamp, Base):
+    """
+    Rollup of the marks of a subject in a section, kept up to date by the extractions
+    and mark updates, so analytics read one row per subject and section instead of
+    every mark.
+
+    Attributes:
+        section_id (int): The section the marks belong to.
+        subject_id (int): The subject the marks belong to.
+        sem_id (int): The semester of the subject.
+        students (int): The number of marks.
+        passed (int): The number of marks with result P.
+        failed (int): The number of marks with result F.
+        absent (int): The number of marks with result A.
+        withheld (int): The number of marks with result W.
+        internal_sum (int): The sum of the internal marks.
+        external_sum (int): The sum of the external marks.
+        total_sum (int): The sum of the total marks.
+        total_min (int): The lowest total mark.
+        total_max (int): The highest total mark.
+        fcd, fc, sc, fail, grade_absent (int): The number of marks of every grade.
+    """
+
+    __tablename__ = "subject_section_stats"
+
+    section_id = Column(
+        Integer,
+        ForeignKey("sections.section_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    subject_id = Column(
+        Integer,
+        ForeignKey("subjects.subject_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sem_id = Column(
+        Integer,
+        ForeignKey("semesters.sem_id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+    students = Column(Integer, nullable=False)
+    passed = Column(Integer, nullable=False)
+    failed = Column(Integer, nullable=False)
+    absent = Column(Integer, nullable=False)
+    withheld = Column(Integer, nullable=False)
+    internal_sum = Column(Integer, nullable=False)
+    external_sum = Column(Integer, nullable=False)
+    total_sum = Column(Integer, nullable=False)
+    total_min = Column(Integer, nullable=False)
+    total_max = Column(Integer, nullable=False)
+    fcd = Column(Integer, nullable=False)
+    fc = Column(Integer, nullable=False)
+    sc = Column(Integer, nullable=False)
+    fail = Column(Integer, nullable=False)
+    grade_absent = Column(Integer, nullable=False)
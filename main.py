@@ -1,23 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Body, FastAPI
 from fastapi.responses import JSONResponse
 
 from api import (
+    analytics,
     batches,
     departments,
+    exports,
     extractions,
     marks,
+    rankings,
     sections,
     semesters,
     student_performances,
     students,
     subjects,
 )
+from api.utils.cache import shared_cache
+from api.utils.extractions.pdf import start_parse_pool, stop_parse_pool
 from celery_worker import create_task
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # drop what the other workers invalidate from this worker's cache
+    shared_cache.start()
+    start_parse_pool()
+    yield
+    stop_parse_pool()
+    await shared_cache.stop()
+
+
 api = FastAPI(
     title="EduInsights API",
     description="API for managing VTU results, analysis and extraction.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -43,3 +62,6 @@ api.include_router(
     tags=["Student Performance APIs"],
 )
 api.include_router(extractions.router, prefix="/extractions", tags=["Extraction APIs"])
+api.include_router(exports.router, prefix="/exports", tags=["Export APIs"])
+api.include_router(analytics.router, prefix="/analytics", tags=["Analytics APIs"])
+api.include_router(rankings.router, prefix="/rankings", tags=["Ranking APIs"])
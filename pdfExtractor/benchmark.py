@@ -0,0 +1,139 @@
+import argparse
+import glob
+import os
+import random
+import time
+
+import fitz
+
+from pdfExtractor import pdfParser
+
+# html of a synthetic result pdf laid out like the VTU results
+FIXTURE_HTML = """
+<style>table, td {{ border: 1px solid black; border-collapse: collapse; }}</style>
+<table>
+<tr><td>University Seat Number</td><td>: {usn}</td></tr>
+<tr><td>Student Name</td><td>: {name}</td></tr>
+</table>
+<p>Semester : 5</p>
+<table>
+<tr><td>Subject Code</td><td>Subject Name</td><td>Internal Marks</td><td>External Marks</td>
+<td>Total</td><td>Result</td><td>Announced / Updated on</td></tr>
+{rows}
+</table>
+"""
+
+FIXTURE_ROW = (
+    "<tr><td>{code}</td><td>{name}</td><td>{internal}</td><td>{external}</td>"
+    "<td>{total}</td><td>{result}</td><td>2024-09-10</td></tr>"
+)
+
+
+# generate synthetic result pdfs
+def generateFixtures(folder, count):
+    """
+    Write synthetic result PDFs with random marks, for when no real PDFs are at hand.
+
+    Parameters:
+        folder (str): The folder to write the PDFs to.
+        count (int): The number of PDFs to generate.
+    """
+    os.makedirs(folder, exist_ok=True)
+    for i in range(1, count + 1):
+        usn = f"1AB21CS{i:03}"
+        rows = []
+        for j in range(1, 8):
+            internal = random.randint(15, 50)
+            external = random.randint(0, 50)
+            rows.append(
+                FIXTURE_ROW.format(
+                    code=f"21CS5{j}",
+                    name=f"SUBJECT NUMBER {j}",
+                    internal=internal,
+                    external=external,
+                    total=internal + external,
+                    result="P" if external >= 18 else "F",
+                )
+            )
+        html = FIXTURE_HTML.format(usn=usn, name=f"STUDENT {i}", rows="".join(rows))
+
+        # Lay the html out on a single A4 page
+        story = fitz.Story(html)
+        writer = fitz.DocumentWriter(os.path.join(folder, f"{usn}.pdf"))
+        mediabox = fitz.paper_rect("a4")
+        device = writer.begin_page(mediabox)
+        story.place(mediabox + (36, 36, -36, -36))
+        story.draw(device)
+        writer.end_page()
+        writer.close()
+
+
+# time one parser over every fixture page
+def timeParser(parse, pages):
+    """
+    Run a parser over a list of pages and measure how long it takes.
+
+    Parameters:
+        parse (callable): `pdfParser.parseWords` or `pdfParser.parseTables`.
+        pages (list): The first page of every fixture PDF.
+
+    Returns:
+        tuple: The total time taken in seconds and the list of parsed results.
+    """
+    start_time = time.perf_counter()
+    results = [parse(page) for page in pages]
+    return time.perf_counter() - start_time, results
+
+
+def benchmark(folder):
+    """
+    Compare the layout template fast path against the generic table detector.
+
+    Every PDF in the folder is parsed with both `pdfParser.parseWords` and
+    `pdfParser.parseTables`. The time taken per file and the number of files
+    on which both paths agree are printed.
+
+    Parameters:
+        folder (str): The path to a folder of VTU result PDFs.
+    """
+    paths = sorted(glob.glob(os.path.join(folder, "*.pdf")))
+    if not paths:
+        print(f"Warning: No PDF files in {folder}...")
+        return
+
+    docs = [fitz.open(path) for path in paths]
+    pages = [doc[0] for doc in docs]
+
+    words_time, words_results = timeParser(pdfParser.parseWords, pages)
+    tables_time, tables_results = timeParser(pdfParser.parseTables, pages)
+
+    valid = sum(pdfParser.isValid(result) for result in words_results)
+    agree = sum(words == tables for words, tables in zip(words_results, tables_results))
+
+    print(f"Files: {len(paths)}")
+    print(f"find_tables:   {tables_time / len(paths) * 1000:.2f} ms/file")
+    print(f"layout words:  {words_time / len(paths) * 1000:.2f} ms/file")
+    print(f"Speedup:       {tables_time / words_time:.1f}x")
+    print(f"Fast path valid on {valid}/{len(paths)} files")
+    print(f"Both paths agree on {agree}/{len(paths)} files")
+
+    for doc in docs:
+        doc.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the PDF parsing paths over a folder of result PDFs."
+    )
+    parser.add_argument("folder", help="folder containing the fixture PDFs")
+    parser.add_argument(
+        "--generate",
+        type=int,
+        default=0,
+        help="write this many synthetic result PDFs to the folder first",
+    )
+    args = parser.parse_args()
+
+    if args.generate:
+        generateFixtures(args.folder, args.generate)
+    benchmark(args.folder)
@@ -2,10 +2,8 @@ import os
 import smtplib
 from email.message import EmailMessage
 
-import authenticate
-import compute
-import driveSheetsOps
-import preprocessing
+from pdfExtractor import preprocessing
+from webExtractor import authenticate, reportSinks
 
 SCOPES = authenticate.SCOPES
 
@@ -71,58 +69,34 @@ def generate_student_result():
     # Extract and process student result data
     students_marks = preprocessing.processResult()
 
-    # Extract top 10 students based on Percentage and SGPA
-    top10 = students_marks.sort_values(
-        by=[("Percentage", ""), ("SGPA", "")], ascending=False
-    )[:10][[("Total", ""), ("Percentage", ""), ("SGPA", "")]]
+    # Extract the top 10 students and the grades of all students
+    students_marks, top10, grades = reportSinks.reportFrames(students_marks)
 
-    # Compute grades for all students
-    grades = compute.grades(students_marks=students_marks)
+    # Publish the report to Google Sheets or a local XLSX / Parquet file
+    sink = reportSinks.chooseSink()
+    location = sink.write(students_marks, top10, grades)
 
-    # Reset index for dataframes
-    students_marks.reset_index(inplace=True)
-    top10.reset_index(inplace=True)
-    grades.reset_index(inplace=True)
-
-    # Authenticate with Google Sheets API
-    sheets = authenticate.sheetsAPI(SCOPES=SCOPES)
-
-    # Create a new spreadsheet
-    spreadsheetId = driveSheetsOps.create_new_spreadsheet(service=sheets)
-
-    # Change access permission for the spreadsheet
-    driveSheetsOps.change_access_permission(spreadsheetId=spreadsheetId)
-
-    # Define starting rows for each dataframe in the spreadsheet
-    start_rows = [
-        2,
-        len(students_marks) + 5,
-        len(students_marks) + len(top10) + 10,
-    ]
-
-    # Prepare dataframes to be written to the spreadsheet
-    dataframes = [students_marks, top10, grades]
-
-    # Write dataframes to the spreadsheet
-    driveSheetsOps.write_to_sheet(sheets, dataframes, start_rows, spreadsheetId)
-
-    # Generate the link to the spreadsheet
-    spreadsheet_link = f"https://docs.google.com/spreadsheets/d/{spreadsheetId}"
-
-    # Print the link to the spreadsheet
-    print(f"You can access the spreadsheet here: {spreadsheet_link}")
-
-    # Prompt user if they want to receive the link through mail
-    print("Do you want to receive the link through email?")
-    mail = int(input("Yes: 1 or No: 0: "))
-
-    # If user chooses to receive the link through email
-    if mail == 1:
-        receiver_email = input("Please enter your email id: ")
-        send_email(receiver_email, spreadsheet_link)
-        print("Thank you! The link has been sent to your email.")
-    else:
+    # Only a spreadsheet link can be shared through mail
+    if not isinstance(sink, reportSinks.SheetsSink):
+        print(f"The report has been written to: {location}")
         print("Thank you!")
+    else:
+        spreadsheet_link = location
+
+        # Print the link to the spreadsheet
+        print(f"You can access the spreadsheet here: {spreadsheet_link}")
+
+        # Prompt user if they want to receive the link through mail
+        print("Do you want to receive the link through email?")
+        mail = int(input("Yes: 1 or No: 0: "))
+
+        # If user chooses to receive the link through email
+        if mail == 1:
+            receiver_email = input("Please enter your email id: ")
+            send_email(receiver_email, spreadsheet_link)
+            print("Thank you! The link has been sent to your email.")
+        else:
+            print("Thank you!")
 
     # except Exception as e:
     #    print(f"An error occurred: {e}")
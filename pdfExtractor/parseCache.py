@@ -0,0 +1,100 @@
+import json
+import os
+import stat
+import tempfile
+
+# location of the cache file, next to the extractor unless PDF_PARSE_CACHE is set
+CACHE_FILE = os.getenv("PDF_PARSE_CACHE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "parse_cache.json"
+)
+
+# bump whenever pdfParser changes its output, so stale entries are dropped
+CACHE_VERSION = 1
+
+
+class ParseCache:
+    """
+    An on-disk cache of parsed result PDFs.
+
+    Entries are keyed by the content hash of the PDF, or the checksum Google Drive reports for it,
+    and hold the compact (details, rows) tuple returned by `pdfParser.parseContent`. A PDF that
+    is already in the cache does not have to be downloaded or parsed again.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or CACHE_FILE
+        self.entries = self._load()
+        self.changed = False
+
+    def _load(self):
+        """Read the entries currently on disk, or none if the file is missing or stale."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as cache_file:
+                cached = json.load(cache_file)
+            if cached.get("version") == CACHE_VERSION:
+                return cached["entries"]
+        except (OSError, ValueError, KeyError):
+            print(f"Warning: Ignoring unreadable parse cache {self.path}...")
+        return {}
+
+    def get(self, key):
+        """
+        Look a parsed PDF up in the cache.
+
+        Parameters:
+            key (str): The cache key of the PDF, or None if it has none.
+
+        Returns:
+            tuple: The cached (details, rows) tuple, or None on a miss.
+        """
+        if key is None or key not in self.entries:
+            return None
+        details, rows = self.entries[key]
+        return details, [tuple(row) for row in rows]
+
+    def put(self, key, parsed):
+        """
+        Store a parsed PDF in the cache.
+
+        Parameters:
+            key (str): The cache key of the PDF, or None if it has none.
+            parsed (tuple): The (details, rows) tuple returned by `pdfParser.parseContent`.
+        """
+        if key is None or parsed is None or key in self.entries:
+            return
+        self.entries[key] = parsed
+        self.changed = True
+
+    def save(self):
+        """
+        Write the cache back to disk if anything was added.
+
+        Entries saved by other runs since this cache was loaded are merged in first, so
+        concurrent jobs sharing the file do not drop each other's results.
+        """
+        if not self.changed:
+            return
+
+        self.entries = {**self._load(), **self.entries}
+
+        # write to a temporary file of our own first, so an interrupted save keeps the
+        # old cache and concurrent saves do not write over each other's temporary file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=os.path.basename(self.path) + ".", suffix=".tmp"
+        )
+        try:
+            # mkstemp creates the file private, keep the mode the cache had
+            mode = os.stat(self.path).st_mode if os.path.exists(self.path) else 0o644
+            os.chmod(tmp_path, stat.S_IMODE(mode))
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(
+                    {"version": CACHE_VERSION, "entries": self.entries}, cache_file
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.changed = False
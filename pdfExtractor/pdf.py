@@ -1,99 +1,121 @@
-import io
-import sys
-import time
+import os
+from collections import deque
+from itertools import islice
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-import authenticate
-import fitz
-import pandas as pd
-from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
+from pdfExtractor import pdfParser
 
-SCOPES = authenticate.SCOPES
+# number of PDFs loaded from the source at the same time
+DOWNLOAD_WORKERS = 8
 
+# number of processes parsing PDFs, one per CPU core
+PARSE_WORKERS = os.cpu_count()
 
-# extracting the pdf content from files list
-def extractContent(file):
+
+# extracting the pdf content of one file
+def extractContent(source, file):
     """
-    Extract content from a PDF file stored in Google Drive.
+    Extract content from a PDF file of a source.
 
     This function retrieves the content from a PDF file and processes it to extract relevant information.
 
     Parameters:
-        file (dict): A dictionary containing metadata of the PDF file, including its ID.
+        source (PDFSource): The source the file belongs to.
+        file (dict): A dictionary containing metadata of the PDF file, as listed by the source.
 
     Returns:
-        tuple: A tuple containing details extracted from the PDF (student details) and a DataFrame
-               containing marks or other tabular data extracted from the PDF.
-        tuple[0] (dict): A dictionary containing student details extracted from the PDF.
-        tuple[1] (DataFrame): A pandas DataFrame containing marks or other tabular data extracted from the PDF.
-
-    Raises:
-        HttpError: An error occurred while attempting to extract content from the PDF file.
+        tuple: The value returned by `pdfParser.parseContent`, or None if the file could not be loaded.
     """
-    # Authenticate with Google Drive API
-    drive = authenticate.driveAPI(SCOPES=SCOPES)
-
-    # Create a BytesIO object to store PDF content
-    pdf_content = io.BytesIO()
-
-    try:
-        # Retrieve the PDF file from Google Drive
-        pdf = drive.files().get_media(fileId=file["id"])
-
-        # Download the PDF content
-        downloader = MediaIoBaseDownload(pdf_content, pdf)
-        done = False
-
-        while not done:
-            status, done = downloader.next_chunk()
-            sys.stdout.write(f"Extracting pdf {file['name']}...    Extracted 0%")
-
-            # Simulate progress bar
-            for _ in range(10):
-                time.sleep(0.1)
-                dash = "-"
-                sys.stdout.write(f"{dash}")
-                sys.stdout.flush()
-
-            if done:
-                sys.stdout.write(f"{int(status.progress() * 100)}%\n")
-                sys.stdout.flush()
-
-        # Reset the pointer to the beginning of the BytesIO object
-        pdf_content.seek(0)
-
-        # Open the PDF document using PyMuPDF (fitz)
-        pdf_doc = fitz.open(stream=pdf_content)
-        page = pdf_doc[0]
-
-        # Find tables in the PDF page
-        tables = page.find_tables()
+    content = source.load(file)
+    if content is None:
+        return None
+    return pdfParser.parseContent(content)
+
+
+# streaming the pdf contents of a files list
+def extractContents(
+    source,
+    files,
+    cache=None,
+    max_workers=DOWNLOAD_WORKERS,
+    parse_workers=PARSE_WORKERS,
+):
+    """
+    Load and parse many PDF files of a source concurrently.
 
-        # Extract details and marks from the tables
-        details = tables[0].extract()
-        details = [details[0][1][2:], details[1][1][2:]]
+    Up to `max_workers` files are loaded (downloaded, for Google Drive) at the same time.
+    Every loaded PDF is handed to a pool of `parse_workers` processes right away, so
+    loading and parsing overlap and parsing is spread across all CPU cores.
+    Files found in the parse cache are neither loaded nor parsed.
 
-        marks = tables[1].extract()
-        marks_df = pd.DataFrame(marks)
+    Loads are submitted through a window of `max_workers + parse_workers` files, and
+    no more parses than that are left waiting, so the PDFs held in memory are bounded
+    whatever the number of files.
 
-        # Clean the DataFrame and format columns
-        marks_df = marks_df.map(
-            lambda x: (x.replace("\n", " ") if isinstance(x, str) else x)
+    Parameters:
+        source (PDFSource): The source the files belong to.
+        files (list): A list of dictionaries containing file metadata, as listed by the source.
+        cache (ParseCache, optional): The parse cache to read from and add new results to.
+        max_workers (int): The maximum number of concurrent loads.
+        parse_workers (int): The number of parser processes.
+
+    Yields:
+        tuple: (file, extracted) in the same order as `files`, where `extracted` is the
+               value returned by `pdfParser.parseContent` or None if the file could not be loaded.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as loads, ProcessPoolExecutor(
+        max_workers=parse_workers
+    ) as parsers:
+        keys = (
+            list(loads.map(source.key, files))
+            if cache is not None
+            else [None] * len(files)
         )
-        marks_df.columns = marks_df.iloc[0]
-        marks_df.drop(0, inplace=True)
-        marks_df.reset_index(drop=True, inplace=True)
-        marks_df.drop(
-            ["Subject Name", "Announced / Updated on"],
-            axis=1,
-            inplace=True,
+        cached = [cache.get(key) if cache is not None else None for key in keys]
+        if cache is not None:
+            hits = sum(parsed is not None for parsed in cached)
+            print(f"{hits}/{len(files)} files found in the parse cache")
+
+        # loads are submitted in the files order, keeping a window of them in flight
+        window = max_workers + parse_workers
+        missing = (file for file, parsed in zip(files, cached) if parsed is None)
+        loading = deque(
+            loads.submit(source.load, file) for file in islice(missing, window)
         )
 
-        return details, marks_df
-    except HttpError as e:
-        if e.resp.status == 404:
-            print("Error: File not found...")
-        elif e.resp.status == 403:
-            print("Error: Permission denied. You do not have access to this file...")
-        else:
-            print(f"Error: {e}")
+        pending = deque()
+        for file, key, parsed in zip(files, keys, cached):
+            if parsed is not None:
+                parsing = Future()
+                parsing.set_result(parsed)
+            else:
+                content = loading.popleft().result()
+                for next_file in islice(missing, 1):
+                    loading.append(loads.submit(source.load, next_file))
+                parsing = (
+                    None
+                    if content is None
+                    else parsers.submit(pdfParser.parseContent, content)
+                )
+            pending.append((file, key, parsing))
+
+            # Hand back the files at the head of the queue that are already parsed
+            while pending and (pending[0][2] is None or pending[0][2].done()):
+                yield _collect(pending.popleft(), cache)
+
+            # Wait for the parsers rather than queueing more loaded PDFs than the window
+            while len(pending) > window:
+                yield _collect(pending.popleft(), cache)
+
+        # Wait for the remaining files to be parsed
+        while pending:
+            yield _collect(pending.popleft(), cache)
+
+
+def _collect(entry, cache):
+    """Return (file, extracted) for a pending entry, adding new results to the cache."""
+    file, key, parsing = entry
+    extracted = parsing.result() if parsing else None
+    if cache is not None and extracted is not None:
+        cache.put(key, extracted)
+    return file, extracted
@@ -0,0 +1,283 @@
+import re
+
+import fitz
+
+# columns of the marks table kept for every subject
+MARKS_COLUMNS = ["Subject Code", "Internal Marks", "External Marks", "Total", "Result"]
+
+# layout template of the VTU result PDF marks table: the first word of every
+# header cell, from left to right, and the column it starts
+HEADER_ANCHORS = [
+    ("Subject", "Subject Code"),
+    ("Subject", "Subject Name"),
+    ("Internal", "Internal Marks"),
+    ("External", "External Marks"),
+    ("Total", "Total"),
+    ("Result", "Result"),
+    ("Announced", "Announced / Updated on"),
+]
+
+# labels of the student details printed above the marks table
+USN_LABEL = ["University", "Seat", "Number"]
+NAME_LABEL = ["Student", "Name"]
+
+# horizontal slack (in points) allowed around the column anchors
+COLUMN_TOLERANCE = 3
+
+USN_PATTERN = re.compile(r"^\d[A-Z]{2}\d{2}[A-Z]{2,3}\d{3}$")
+SUBJECT_CODE_PATTERN = re.compile(r"^[A-Z0-9]{5,10}$")
+MARK_PATTERN = re.compile(r"^\d{1,3}$")
+RESULTS = {"P", "F", "A", "W", "X", "NE"}
+
+
+def _find_label(words, label):
+    """
+    Find the words of a label printed on one line.
+
+    Parameters:
+        words (list): The words of the page as returned by `page.get_text("words")`.
+        label (list): The consecutive words making up the label.
+
+    Returns:
+        tuple: The words of the label, or None if the label is not on the page.
+    """
+    texts = [word[4] for word in words]
+    for i in range(len(words) - len(label) + 1):
+        if texts[i : i + len(label)] == label:
+            return words[i : i + len(label)]
+    return None
+
+
+def _label_value(words, label):
+    """
+    Read the value printed to the right of a label, on the same line.
+
+    Parameters:
+        words (list): The words of the page as returned by `page.get_text("words")`.
+        label (list): The consecutive words making up the label.
+
+    Returns:
+        str: The value without the ":" separator, or None if the label is not on the page.
+    """
+    found = _find_label(words, label)
+    if found is None:
+        return None
+
+    x1 = found[-1][2]
+    y_center = (found[0][1] + found[0][3]) / 2
+    value = [
+        word
+        for word in words
+        if word[0] > x1 and word[1] <= y_center <= word[3] and word not in found
+    ]
+    value.sort(key=lambda word: word[0])
+    return " ".join(word[4] for word in value).lstrip(":").strip()
+
+
+def _column_bands(words):
+    """
+    Compute the x range of every column of the marks table from its header.
+
+    Parameters:
+        words (list): The words of the page as returned by `page.get_text("words")`.
+
+    Returns:
+        tuple: A dict mapping column names to (x0, x1) and the top of the header,
+               or None if the header does not match the layout template.
+    """
+    internal = next((word for word in words if word[4] == "Internal"), None)
+    if internal is None:
+        return None
+
+    # header cells start on the same line, longer labels wrap below it
+    header = [
+        word
+        for word in words
+        if abs(word[1] - internal[1]) < 2
+        and word[4] in {anchor for anchor, _ in HEADER_ANCHORS}
+    ]
+    header.sort(key=lambda word: word[0])
+    if [word[4] for word in header] != [anchor for anchor, _ in HEADER_ANCHORS]:
+        return None
+
+    bands = {}
+    for i, (word, (_, column)) in enumerate(zip(header, HEADER_ANCHORS)):
+        x0 = word[0] - COLUMN_TOLERANCE
+        x1 = (
+            header[i + 1][0] - COLUMN_TOLERANCE if i + 1 < len(header) else float("inf")
+        )
+        bands[column] = (x0, x1)
+    return bands, internal[1]
+
+
+def _column_of(word, bands):
+    """Return the column a word falls in, or None."""
+    for column, (x0, x1) in bands.items():
+        if x0 <= word[0] < x1:
+            return column
+    return None
+
+
+def parseWords(page):
+    """
+    Parse a VTU result PDF page by reading words at the positions given by the layout template.
+
+    The marks table columns are located from the header anchors, every subject code starts a
+    row and the remaining cells are assigned to the row closest to them vertically. This is
+    much cheaper than detecting the table lines with `find_tables`.
+
+    Parameters:
+        page (Page): The first page of the result PDF.
+
+    Returns:
+        tuple: The same (details, rows) tuple as `parseTables`, or None if the page does not
+               match the layout template.
+    """
+    words = page.get_text("words")
+
+    details = [_label_value(words, USN_LABEL), _label_value(words, NAME_LABEL)]
+
+    found = _column_bands(words)
+    if found is None:
+        return None
+    bands, header_top = found
+
+    # every subject code below the header starts a new row
+    codes = [
+        word
+        for word in words
+        if word[1] > header_top
+        and _column_of(word, bands) == "Subject Code"
+        and SUBJECT_CODE_PATTERN.match(word[4])
+    ]
+    if not codes:
+        return None
+    codes.sort(key=lambda word: word[1])
+
+    # cells must lie between the wrapped header lines and one row below the last subject
+    row_height = codes[0][3] - codes[0][1]
+    top = codes[0][1] - row_height / 2
+    bottom = codes[-1][3] + row_height
+
+    cells = [{column: [] for column in MARKS_COLUMNS[1:]} for _ in codes]
+    for word in words:
+        column = _column_of(word, bands)
+        if column not in cells[0] or not top < word[1] < bottom:
+            continue
+
+        # assign the word to the subject row closest to it
+        y_center = (word[1] + word[3]) / 2
+        row = min(
+            range(len(codes)),
+            key=lambda i: abs((codes[i][1] + codes[i][3]) / 2 - y_center),
+        )
+        cells[row][column].append(word[4])
+
+    rows = [
+        tuple([code[4]] + [" ".join(row[column]) for column in MARKS_COLUMNS[1:]])
+        for code, row in zip(codes, cells)
+    ]
+
+    return details, rows
+
+
+def parseTables(page):
+    """
+    Parse a VTU result PDF page with PyMuPDF's generic table detector.
+
+    Parameters:
+        page (Page): The first page of the result PDF.
+
+    Returns:
+        tuple: A tuple containing details extracted from the PDF (student details) and the marks rows.
+        tuple[0] (list): A list containing the USN and name of the student.
+        tuple[1] (list): A list of (Subject Code, Internal Marks, External Marks, Total, Result) tuples.
+    """
+    # Find tables in the PDF page
+    tables = page.find_tables()
+
+    # Extract details and marks from the tables
+    details = tables[0].extract()
+    details = [details[0][1][2:], details[1][1][2:]]
+
+    marks = tables[1].extract()
+
+    # Locate the columns we need from the header row
+    header = [cell.replace("\n", " ") if cell else cell for cell in marks[0]]
+    indexes = [header.index(column) for column in MARKS_COLUMNS]
+
+    # Keep only the needed cells of every subject row, skipping rows left empty by
+    # merged cells
+    rows = [
+        tuple(
+            row[index].replace("\n", " ") if row[index] else row[index]
+            for index in indexes
+        )
+        for row in marks[1:]
+        if any(row[index] for index in indexes)
+    ]
+
+    return details, rows
+
+
+def isValid(parsed):
+    """
+    Check that parsed content looks like a VTU result.
+
+    Parameters:
+        parsed (tuple): The (details, rows) tuple returned by one of the parsers.
+
+    Returns:
+        bool: True if the USN, name and every marks row are well formed.
+    """
+    if parsed is None:
+        return False
+
+    (usn, name), rows = parsed
+    if not usn or not USN_PATTERN.match(usn) or not name:
+        return False
+
+    for code, internal, external, total, result in rows:
+        # merged or empty cells are extracted as None
+        if not code or not SUBJECT_CODE_PATTERN.match(code):
+            return False
+        marks = (internal, external, total)
+        if not all(mark and MARK_PATTERN.match(mark) for mark in marks):
+            return False
+        if result not in RESULTS:
+            return False
+    return True
+
+
+# parsing the content of a result pdf
+def parseContent(content):
+    """
+    Parse the student details and marks table out of a VTU result PDF.
+
+    The layout template fast path (`parseWords`) is tried first and the generic table
+    detector (`parseTables`) is only used when its output fails validation. This function
+    is run inside the parse process pool, so it only takes and returns plain Python objects
+    that are cheap to send between processes.
+
+    Parameters:
+        content (bytes | str): The raw content of the PDF file, or the path of a local PDF file.
+
+    Returns:
+        tuple: A tuple containing details extracted from the PDF (student details) and the marks rows.
+        tuple[0] (list): A list containing the USN and name of the student.
+        tuple[1] (list): A list of (Subject Code, Internal Marks, External Marks, Total, Result) tuples.
+    """
+    # Open the PDF document using PyMuPDF (fitz), local files are read straight from disk
+    if isinstance(content, str):
+        pdf_doc = fitz.open(content, filetype="pdf")
+    else:
+        pdf_doc = fitz.open(stream=content, filetype="pdf")
+
+    with pdf_doc:
+        page = pdf_doc[0]
+
+        parsed = parseWords(page)
+        if not isValid(parsed):
+            parsed = parseTables(page)
+
+    return parsed
@@ -1,18 +1,24 @@
-import compute
-import driveSheetsOps
 import pandas as pd
-import pdf
 from tqdm import tqdm
 
+from pdfExtractor import parseCache, pdf, sources
+from webExtractor import compute
+
 
 # extract and process the PDF files
-def processResult():
+def processResult(location=None, credits=None, cache_path=None):
     """
-    Extract and process student results from PDF files stored in a Google Drive folder.
+    Extract and process student results from PDF files stored in a Google Drive folder, a local folder or a zip archive.
 
-    This function prompts the user to enter the link to a Google Drive folder containing PDF files of student results.
+    This function prompts the user to enter the link to a Google Drive folder, or the path to a local folder or
+    zip archive, containing PDF files of student results, unless they are passed in.
     It then extracts data from each PDF file, processes it, and returns a DataFrame containing student details and their results.
 
+    Parameters:
+        location (str, optional): A Google Drive folder link, a local folder path or a local zip archive path.
+        credits (list, optional): The credits of each subject, in the order the subjects appear in the PDFs.
+        cache_path (str, optional): The parse cache file, parseCache.CACHE_FILE by default.
+
     Returns:
         DataFrame: A pandas DataFrame containing student details (USN and Name) and their respective marks and other result data.
                     The DataFrame is indexed by USN and Name.
@@ -20,11 +26,15 @@ def processResult():
     Raises:
         ValueError: An error occurred while processing the data.
     """
-    # Prompt the user to enter the Google Drive folder link
-    folder_link = input("Please enter the drive link: ")
+    # Prompt the user to enter the Google Drive folder link, local folder or zip archive
+    if location is None:
+        location = input(
+            "Please enter the drive link, folder path or zip archive path: "
+        )
+    source = sources.openSource(location)
 
     # Retrieve the list of files from the specified folder
-    files = driveSheetsOps.files_list(folder_link)
+    files = source.files()
 
     # Initialize DataFrames to store student details and marks
     details_df = pd.DataFrame(columns=["USN", "Name"])
@@ -32,21 +42,30 @@ def processResult():
 
     # Process each file if files are found in the folder
     if files:
-        for i in tqdm(range(len(files))):
+        # Load the PDF files concurrently and parse each one as it arrives,
+        # skipping the files that were already parsed on a previous run
+        cache = parseCache.ParseCache(cache_path)
+        extracted_files = pdf.extractContents(source, files, cache)
+        for i, (file, extracted) in enumerate(tqdm(extracted_files, total=len(files))):
+            # Skip files that could not be downloaded
+            if extracted is None:
+                print(f"Ignoring {file['name']} because it could not be loaded")
+                continue
+
             # Extract details and marks from the PDF file
-            details, marks_df = pdf.extractContent(file=files[i])
+            details, marks_rows = extracted
 
             # Ignore students with no or one subject (likely dropped out)
-            if len(marks_df) == 1 or len(marks_df) == 0:
+            if len(marks_rows) == 1 or len(marks_rows) == 0:
                 print(f"Ignoring {details[0]} because He/She has dropped out")
                 continue
 
             # Append student details to details DataFrame
             details_df.loc[i] = details
 
-            # Initialize DataFrame to store marks if processing the first file
-            if i == 0:
-                subcodes = marks_df["Subject Code"].tolist()
+            # Initialize DataFrame to store marks if processing the first valid file
+            if students_marks.columns.empty:
+                subcodes = [row[0] for row in marks_rows]
                 marks = ["INT", "EXT", "TOT", "RESULT"]
                 cols = pd.MultiIndex.from_product([subcodes, marks])
                 students_marks = pd.DataFrame(columns=cols)
@@ -54,24 +73,17 @@ def processResult():
                 students_marks["Percentage"] = 0
                 students_marks["SGPA"] = 0
 
-                credits = []
-                print("Please enter the credits:")
-                for code in subcodes:
-                    c = int(input(f"{code}:"))
-                    credits.append(c)
+                if credits is None:
+                    credits = []
+                    print("Please enter the credits:")
+                    for code in subcodes:
+                        c = int(input(f"{code}:"))
+                        credits.append(c)
 
             # Flatten and append marks to students_marks DataFrame
             values = []
-            for mark in marks_df[
-                [
-                    "Internal Marks",
-                    "External Marks",
-                    "Total",
-                    "Result",
-                ]
-            ].values:
-                for val in mark:
-                    values.append(val)
+            for _, internal, external, total, result in marks_rows:
+                values.extend([internal, external, total, result])
             values.append("0")
             values.append("0")
             values.append("0")
@@ -89,6 +101,9 @@ def processResult():
             # Calculate SGPA using function compute_SGPA
             students_marks.at[i, "SGPA"] = compute.SGPA(totals, credits)
 
+        # Keep the newly parsed files for the next run
+        cache.save()
+
         # Combine student details and marks DataFrames
         students_marks = pd.concat([details_df, students_marks], axis=1)
 
@@ -0,0 +1,206 @@
+import hashlib
+import io
+import os
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
+
+
+class PDFSource(ABC):
+    """
+    A place result PDFs are read from.
+
+    Every source lists its PDF files as dicts holding at least a "name" key, sorted by
+    name, and loads a file into something `pdfParser.parseContent` accepts: the raw PDF
+    bytes or the path of a local PDF file.
+    """
+
+    @abstractmethod
+    def files(self):
+        """
+        List the PDF files of the source.
+
+        Returns:
+            list: A list of dictionaries containing file metadata, or None if the source has no files.
+        """
+
+    @abstractmethod
+    def load(self, file):
+        """
+        Load one PDF file of the source.
+
+        Parameters:
+            file (dict): One of the dictionaries returned by `files`.
+
+        Returns:
+            bytes | str: The PDF content or its local path, or None if the file could not be read.
+        """
+
+    def key(self, file):
+        """
+        Return the parse cache key of one PDF file, without loading it.
+
+        Parameters:
+            file (dict): One of the dictionaries returned by `files`.
+
+        Returns:
+            str: A key that changes whenever the content of the file changes, or None.
+        """
+        return None
+
+
+class LocalFolderSource(PDFSource):
+    """
+    The PDF files of a folder on the local disk.
+
+    Files are loaded as paths, so the parser processes open them straight from disk
+    instead of receiving a copy of their bytes.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def files(self):
+        names = sorted(
+            name for name in os.listdir(self.folder) if name.lower().endswith(".pdf")
+        )
+        if not names:
+            print("Warning: No Files in the Folder...")
+            return None
+        return [
+            {"name": name, "path": os.path.join(self.folder, name)} for name in names
+        ]
+
+    def load(self, file):
+        return file["path"]
+
+    def key(self, file):
+        # hashing a local file is far cheaper than parsing it
+        md5 = hashlib.md5()
+        with open(file["path"], "rb") as pdf_file:
+            for chunk in iter(lambda: pdf_file.read(1 << 16), b""):
+                md5.update(chunk)
+        return f"md5:{md5.hexdigest()}"
+
+
+class ZipArchiveSource(PDFSource):
+    """
+    The PDF files of a zip archive on the local disk.
+
+    Members are decompressed one at a time as they are loaded, the archive is never
+    extracted to disk.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._zip = zipfile.ZipFile(archive)
+
+        # reads share the archive's file handle, so they are serialised
+        self._lock = threading.Lock()
+
+    def files(self):
+        members = sorted(
+            (
+                member
+                for member in self._zip.infolist()
+                if not member.is_dir() and member.filename.lower().endswith(".pdf")
+            ),
+            key=lambda member: member.filename,
+        )
+        if not members:
+            print("Warning: No Files in the Archive...")
+            return None
+        return [
+            {
+                "name": os.path.basename(member.filename),
+                "member": member.filename,
+                "crc": member.CRC,
+                "size": member.file_size,
+            }
+            for member in members
+        ]
+
+    def load(self, file):
+        with self._lock:
+            return self._zip.read(file["member"])
+
+    def key(self, file):
+        # the archive already stores a checksum of every member
+        return f"crc32:{file['crc']:08x}:{file['size']}"
+
+
+class DriveFolderSource(PDFSource):
+    """
+    The PDF files of a Google Drive folder.
+
+    Downloads share the process-wide Drive client of `authenticate`, which runs each
+    request over the calling thread's own HTTP connection.
+    """
+
+    def __init__(self, folder_link):
+        self.folder_link = folder_link
+
+    def files(self):
+        # imported here so local sources never touch the Google APIs
+        from webExtractor import driveSheetsOps
+
+        return driveSheetsOps.files_list(self.folder_link)
+
+    def key(self, file):
+        # Drive reports an md5 checksum for binary files like PDFs
+        if file.get("md5Checksum"):
+            return f"md5:{file['md5Checksum']}"
+        if file.get("modifiedTime"):
+            return f"drive:{file['id']}:{file['modifiedTime']}"
+        return None
+
+    def load(self, file):
+        # Create a BytesIO object to store PDF content
+        pdf_content = io.BytesIO()
+
+        try:
+            # imported here so local sources never touch the Google APIs
+            from webExtractor import authenticate
+
+            # Retrieve the PDF file from Google Drive over this thread's connection
+            drive = authenticate.driveAPI(SCOPES=authenticate.SCOPES)
+            pdf = drive.files().get_media(fileId=file["id"])
+
+            # Download the PDF content
+            downloader = MediaIoBaseDownload(pdf_content, pdf)
+            done = False
+
+            while not done:
+                _, done = downloader.next_chunk()
+
+            return pdf_content.getvalue()
+        except HttpError as e:
+            if e.resp.status == 404:
+                print(f"Error: File {file['name']} not found...")
+            elif e.resp.status == 403:
+                print(
+                    f"Error: Permission denied. You do not have access to {file['name']}..."
+                )
+            else:
+                print(f"Error: {e}")
+
+
+# pick the source matching a drive link, folder path or zip archive path
+def openSource(location):
+    """
+    Open the PDF source a location points to.
+
+    Parameters:
+        location (str): A Google Drive folder link, a local folder path or a local zip archive path.
+
+    Returns:
+        PDFSource: The source reading PDFs from that location.
+    """
+    if os.path.isdir(location):
+        return LocalFolderSource(location)
+    if os.path.isfile(location) and zipfile.is_zipfile(location):
+        return ZipArchiveSource(location)
+    return DriveFolderSource(location)
@@ -0,0 +1,86 @@
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+# grades stored in marks.grade, in the order they are reported
+GRADES = ["FCD", "FC", "SC", "FAIL", "ABSENT"]
+
+
+class AnalyticsScopeParams:
+    def __init__(
+        self,
+        section_id: Optional[int] = Query(None, description="Section ID"),
+        batch_id: Optional[int] = Query(None, description="Batch ID"),
+        sem_id: Optional[int] = Query(None, description="Semester ID"),
+    ):
+        if not (section_id or batch_id or sem_id):
+            raise HTTPException(
+                status_code=422,
+                detail="One of section_id, batch_id or sem_id is required",
+            )
+        self.section_id = section_id
+        self.batch_id = batch_id
+        self.sem_id = sem_id
+
+
+class GradeDistribution(BaseModel):
+    subject_id: int
+    sub_code: str
+    sub_name: str
+    students: int
+    counts: Dict[str, int]
+    percentages: Dict[str, float]
+
+
+class SubjectStats(BaseModel):
+    section_id: int
+    subject_id: int
+    sem_id: int
+    sub_code: str
+    students: int
+    passed: int
+    failed: int
+    absent: int
+    withheld: int
+    pass_percentage: float
+    average_internal: float
+    average_external: float
+    average_total: float
+    total_min: int
+    total_max: int
+    grades: Dict[str, int]
+
+
+class TrendScopeParams:
+    def __init__(
+        self,
+        stud_id: Optional[int] = Query(None, description="Student ID"),
+        section_id: Optional[int] = Query(None, description="Section ID"),
+        batch_id: Optional[int] = Query(None, description="Batch ID"),
+    ):
+        if not (stud_id or section_id or batch_id):
+            raise HTTPException(
+                status_code=422,
+                detail="One of stud_id, section_id or batch_id is required",
+            )
+        self.stud_id = stud_id
+        self.section_id = section_id
+        self.batch_id = batch_id
+
+
+class TrendPoint(BaseModel):
+    sem_id: int
+    sem_num: int
+    students: int
+    sgpa: float
+    percentage: float
+    sgpa_delta: Optional[float] = None
+    percentage_delta: Optional[float] = None
+
+
+class Trend(BaseModel):
+    stud_id: Optional[int] = None
+    section_id: Optional[int] = None
+    batch_id: Optional[int] = None
+    semesters: List[TrendPoint]
@@ -101,3 +101,16 @@ class Batch(BatchBase):
 
     class Config:
         from_attributes = True
+
+
+class BatchCgpa(BaseModel):
+    """
+    Pydantic model representing a CGPA recomputation of a batch.
+
+    Attributes:
+        batch_id (int): The batch whose students were recomputed.
+        students (int): The number of students whose CGPA was updated.
+    """
+
+    batch_id: int
+    students: int
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from fastapi import Query
+
+# media types of the export formats
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class ExportParams:
+    def __init__(
+        self,
+        format: str = Query(
+            "ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"
+        ),
+        sem_id: Optional[int] = Query(
+            None, description="Only export rows of this semester"
+        ),
+    ):
+        self.format = format
+        self.sem_id = sem_id
@@ -0,0 +1,29 @@
+from typing import Generic, List, Optional, TypeVar
+
+from fastapi import Query
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# rows returned per page when no limit is given, and the largest limit accepted
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class PageParams:
+    def __init__(
+        self,
+        cursor: Optional[int] = Query(
+            None, description="Return rows after this ID (next_cursor of the last page)"
+        ),
+        limit: int = Query(
+            DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Maximum number of rows"
+        ),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[int] = None
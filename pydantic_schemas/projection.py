@@ -0,0 +1,17 @@
+from typing import Optional
+
+from fastapi import Query
+
+
+class FieldParams:
+    def __init__(
+        self,
+        fields: Optional[str] = Query(
+            None, description="Comma separated fields to return, e.g. stud_id,total"
+        ),
+    ):
+        self.fields = (
+            [field.strip() for field in fields.split(",") if field.strip()]
+            if fields
+            else None
+        )
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel
+
+
+class RankingParams:
+    def __init__(
+        self,
+        sem_id: int = Query(..., description="Semester ID"),
+        section_id: Optional[int] = Query(None, description="Section ID"),
+        batch_id: Optional[int] = Query(None, description="Batch ID"),
+        metric: str = Query(
+            "sgpa", pattern="^(sgpa|percentage|total)$", description="Ranked value"
+        ),
+        method: str = Query(
+            "rank",
+            pattern="^(rank|dense_rank)$",
+            description="rank leaves gaps after ties, dense_rank does not",
+        ),
+    ):
+        self.sem_id = sem_id
+        self.section_id = section_id
+        self.batch_id = batch_id
+        self.metric = metric
+        self.method = method
+
+
+class Ranking(BaseModel):
+    rank: int
+    stud_id: int
+    usn: str
+    stud_name: str
+    section_id: int
+    total: int
+    percentage: float
+    sgpa: float
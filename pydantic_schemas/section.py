@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from fastapi import Query
 from pydantic import BaseModel, validator
@@ -80,3 +80,27 @@ class Section(SectionBase):
 
     class Config:
         from_attributes = True
+
+
+class ResultSheetMark(BaseModel):
+    internal: int
+    external: int
+    total: int
+    result: str
+
+
+class ResultSheetRow(BaseModel):
+    stud_id: int
+    usn: str
+    stud_name: str
+    marks: Dict[str, ResultSheetMark]
+    total: Optional[int] = None
+    percentage: Optional[float] = None
+    sgpa: Optional[float] = None
+
+
+class ResultSheet(BaseModel):
+    section_id: int
+    sem_id: int
+    subjects: List[str]
+    students: List[ResultSheetRow]
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import Query
+from fastapi import HTTPException, Query
 from pydantic import BaseModel
 
 
@@ -60,3 +60,57 @@ class Student(StudentBase):
 
     class Config:
         from_attributes = True
+
+
+class ProfileMark(BaseModel):
+    subject_id: int
+    sub_code: str
+    sub_name: str
+    credits: int
+    internal: int
+    external: int
+    total: int
+    result: str
+    grade: str
+
+
+class ProfileSemester(BaseModel):
+    sem_id: int
+    sem_num: int
+    total: Optional[int] = None
+    percentage: Optional[float] = None
+    sgpa: Optional[float] = None
+    marks: List[ProfileMark]
+
+
+class StudentProfile(Student):
+    semesters: List[ProfileSemester]
+
+
+class StudentSearchParams:
+    def __init__(
+        self,
+        q: str = Query(
+            ..., min_length=1, max_length=100, description="USN prefix or student name"
+        ),
+        batch_id: Optional[int] = Query(None, description="Batch ID"),
+        section_id: Optional[int] = Query(None, description="Section ID"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
+    ):
+        # min_length is checked before stripping, so blank queries are rejected here
+        q = q.strip()
+        if not q:
+            raise HTTPException(status_code=422, detail="q must not be blank")
+        self.q = q
+        self.batch_id = batch_id
+        self.section_id = section_id
+        self.limit = limit
+
+
+class StudentSearchResult(BaseModel):
+    stud_id: int
+    usn: str
+    stud_name: str
+    batch_id: int
+    section_id: int
+    score: float
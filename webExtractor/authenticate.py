@@ -1,23 +1,25 @@
 import os
+import threading
+from datetime import datetime, timedelta
 
+import httplib2
 from dotenv import load_dotenv
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
-# Get the absolute path to the directory containing this Python script (alembic folder)
+# Get the absolute path to the directory containing this Python script
 current_dir = os.path.dirname(os.path.abspath(__file__))
-print(f"Current directory: {current_dir}", flush=True)
 
-# Get the absolute path to the project root directory (two levels up from the current directory)
+# Get the absolute path to the project root directory (one level up from the current directory)
 project_root = os.path.abspath(os.path.join(current_dir, ".", ".."))
-print(f"Project root directory: {project_root}", flush=True)
 
 # Load environment variables from the .env file located in the project root directory
 dotenv_path = os.path.join(project_root, ".env")
-print(f"Loading environment variables from: {dotenv_path}", flush=True)
 load_dotenv(dotenv_path)
 
 # defining credentials file path from environment variable
@@ -29,12 +31,128 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# credentials are refreshed this long before they expire, so no request sees an expired token
+REFRESH_MARGIN = timedelta(minutes=5)
+
+# credentials and services built so far, shared by every thread of the process
+_credentials = None
+_services = {}
+_lock = threading.RLock()
+
+# HTTP connections, one per thread since httplib2 is not thread-safe
+_thread_local = threading.local()
+
+
+def _expiring(credentials):
+    """Return True if the credentials are invalid or expire within REFRESH_MARGIN."""
+    if not credentials.valid:
+        return True
+    # google-auth keeps the expiry as a naive UTC datetime
+    return bool(
+        credentials.expiry and credentials.expiry - REFRESH_MARGIN <= datetime.utcnow()
+    )
+
+
+# load (and refresh if needed) the OAuth credentials shared by all services
+def get_credentials(SCOPES):
+    """
+    Load the OAuth 2.0 credentials from token.json, refreshing or re-authenticating when required.
+
+    The credentials are kept in memory and shared by every thread, so token.json is only read
+    once. They are refreshed as soon as they get within REFRESH_MARGIN of their expiry.
+
+    Parameters:
+        SCOPES (list): A list of OAuth 2.0 scopes defining the level of access to Google resources.
+
+    Returns:
+        Credentials: Valid OAuth 2.0 user credentials.
+    """
+    global _credentials
+
+    with _lock:
+        # Reuse the credentials loaded earlier while they are not about to expire
+        if _credentials and not _expiring(_credentials):
+            return _credentials
+
+        credentials = _credentials
+
+        # Check if token file exists
+        if credentials is None and os.path.exists("token.json"):
+            credentials = Credentials.from_authorized_user_file(
+                "token.json", scopes=SCOPES
+            )
+
+        # If credentials are not valid, expiring or do not exist, perform authentication
+        if not credentials or _expiring(credentials):
+            if credentials and credentials.refresh_token:
+                # Refresh the expired or expiring credentials
+                credentials.refresh(Request())
+            else:
+                # Perform OAuth 2.0 authentication
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    credentials_file_path, SCOPES
+                )
+                credentials = flow.run_local_server(port=0)
+
+            # Save the refreshed or newly acquired credentials to token file
+            with open("token.json", "w") as token:
+                token.write(credentials.to_json())
+
+        _credentials = credentials
+        return credentials
+
+
+def _thread_http():
+    """
+    Return the authorized HTTP connection owned by the calling thread.
+
+    The connection is created on the first request of a thread and kept open for all its
+    later requests, whichever service they are made on.
+
+    Returns:
+        AuthorizedHttp: An HTTP object authorized with the shared credentials.
+    """
+    if not hasattr(_thread_local, "http"):
+        _thread_local.http = AuthorizedHttp(
+            get_credentials(SCOPES), http=httplib2.Http()
+        )
+    return _thread_local.http
+
+
+def _build_request(http, *args, **kwargs):
+    """Build every service request over the calling thread's connection."""
+    # refresh the shared credentials ahead of time, under the lock
+    get_credentials(SCOPES)
+    return HttpRequest(_thread_http(), *args, **kwargs)
+
+
+def _service(name, version, SCOPES):
+    """
+    Return the shared service object of a Google API, building it on the first call.
+
+    Service objects are safe to share between threads because their requests are built
+    by `_build_request`, so each one is executed over its own thread's connection.
+    """
+    with _lock:
+        if (name, version) not in _services:
+            _services[(name, version)] = build(
+                name,
+                version,
+                credentials=get_credentials(SCOPES),
+                requestBuilder=_build_request,
+                cache_discovery=False,
+            )
+        return _services[(name, version)]
+
 
 # authenticate drive API
 def driveAPI(SCOPES):
     """
     Authenticate with Google Drive API.
 
+    The service is built once per process and the same object is returned on every later
+    call, from any thread.
+
     Parameters:
         SCOPES (list): A list of OAuth 2.0 scopes defining the level of access to Google Drive resources.
 
@@ -44,33 +162,9 @@ def driveAPI(SCOPES):
     Raises:
         HttpError: An error occurred while attempting to authenticate or build the service.
     """
-    credentials = None
-
-    # Check if token file exists
-    if os.path.exists("token.json"):
-        credentials = Credentials.from_authorized_user_file("token.json", scopes=SCOPES)
-
-    # If credentials are not valid or do not exist, perform authentication
-    if not credentials or not credentials.valid:
-        if credentials and credentials.expired and credentials.refresh_token:
-            # Refresh the expired credentials
-            credentials.refresh(Request())
-        else:
-            # Perform OAuth 2.0 authentication
-            flow = InstalledAppFlow.from_client_secrets_file(
-                credentials_file_path, SCOPES
-            )
-            credentials = flow.run_local_server(port=0)
-
-        # Save the refreshed or newly acquired credentials to token file
-        with open("token.json", "w") as token:
-            token.write(credentials.to_json())
-
     try:
         # Build the Google Drive service
-        drive_service = build("drive", "v3", credentials=credentials)
-
-        return drive_service
+        return _service("drive", "v3", SCOPES)
     except HttpError as error:
         # Handle any HTTP errors
         print(error)
@@ -81,6 +175,9 @@ def sheetsAPI(SCOPES):
     """
     Authenticate with Google Sheets API.
 
+    The service is built once per process and the same object is returned on every later
+    call, from any thread.
+
     Parameters:
         SCOPES (list): A list of OAuth 2.0 scopes defining the level of access to Google Sheets resources.
 
@@ -90,37 +187,9 @@ def sheetsAPI(SCOPES):
     Raises:
         HttpError: An error occurred while attempting to authenticate or build the service.
     """
-    credentials = None
-
-    # Check if token file exists
-    if os.path.exists("token.json"):
-        credentials = Credentials.from_authorized_user_file("token.json", scopes=SCOPES)
-
-    # If credentials are not valid or do not exist, perform authentication
-    if not credentials or not credentials.valid:
-        if credentials and credentials.expired and credentials.refresh_token:
-            # Refresh the expired credentials
-            credentials.refresh(Request())
-        else:
-            # Perform OAuth 2.0 authentication
-            flow = InstalledAppFlow.from_client_secrets_file(
-                credentials_file_path, SCOPES
-            )
-            credentials = flow.run_local_server(port=0)
-
-        # Save the refreshed or newly acquired credentials to token file
-        with open("token.json", "w") as token:
-            token.write(credentials.to_json())
-
     try:
         # Build the Google Sheets service
-        sheets_service = build("sheets", "v4", credentials=credentials)
-
-        return sheets_service
+        return _service("sheets", "v4", SCOPES)
     except HttpError as error:
         # Handle any HTTP errors
         print(error)
-
-
-# Authenticate both drive and sheets API
-driveAPI(SCOPES)
@@ -5,19 +5,21 @@ from tqdm import tqdm
 
 
 # calculate the SGPA
-def SGPA(totals):
+def SGPA(totals, credits=None):
     """
     Compute the Semester Grade Point Average (SGPA) based on the total marks of subjects and their respective credits.
 
     Args:
         totals (list): A list of total marks obtained in each subject.
+        credits (list, optional): The credits of each subject, in the same order as totals.
+            Read from credits.json when not given.
 
     Returns:
         float: The calculated SGPA.
 
     Description:
         This function calculates the Semester Grade Point Average (SGPA) based on the total marks obtained in each subject
-        and their respective credits. It reads the credits associated with each subject from a JSON file. The JSON file
+        and their respective credits. Unless they are passed in, it reads the credits associated with each subject from a JSON file. The JSON file
         is expected to contain an array of integers representing the credits for each subject in the same order as the
         subjects appear in the totals list. The function iterates over the total marks and corresponding credits to
         calculate the grade points for each subject. It then calculates the weighted sum of grade points and divides
@@ -39,9 +41,10 @@ def SGPA(totals):
     sum_credits = 0  # Initialize total credits
 
     # Read credits from JSON file
-    filename = "credits.json"
-    with open(filename) as json_file:
-        credits = json.load(json_file)
+    if credits is None:
+        filename = "credits.json"
+        with open(filename) as json_file:
+            credits = json.load(json_file)
 
     # Iterate over total marks and credits simultaneously
     for total, credit in zip(totals, credits):
@@ -1,9 +1,13 @@
-import authenticate
 from googleapiclient.errors import HttpError
 from tqdm import tqdm
 
+from webExtractor import authenticate
+
 SCOPES = authenticate.SCOPES
 
+# files listed per request, the largest page the Drive API returns
+PAGE_SIZE = 1000
+
 
 # retrieve files list in drive link
 def files_list(folder_link):
@@ -14,7 +18,7 @@ def files_list(folder_link):
         folder_link (str): The link to the Google Drive folder.
 
     Returns:
-        list: A list of dictionaries containing file metadata (id and name) for files within the specified folder,
+        list: A list of dictionaries containing file metadata (id, name, md5Checksum and modifiedTime) for files within the specified folder,
               or None if no files are found in the folder.
 
     Raises:
@@ -24,16 +28,25 @@ def files_list(folder_link):
     folder_id = folder_link.split("/")[-1:][0]
     print("Fetching list of files...")
     try:
-        response = (
-            drive.files()
-            .list(
-                q=f"'{folder_id}' in parents",
-                orderBy="name",
-                fields="files(id, name)",
+        files_list = []
+        page_token = None
+        # a single list call returns one page only, so follow nextPageToken to the end
+        while True:
+            response = (
+                drive.files()
+                .list(
+                    q=f"'{folder_id}' in parents",
+                    orderBy="name",
+                    pageSize=PAGE_SIZE,
+                    pageToken=page_token,
+                    fields="nextPageToken, files(id, name, md5Checksum, modifiedTime)",
+                )
+                .execute()
             )
-            .execute()
-        )
-        files_list = response.get("files", [])
+            files_list.extend(response.get("files", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
         if not files_list:
             print("Warning: No Files in the Folder...")
         else:
@@ -47,24 +60,23 @@ def files_list(folder_link):
 
 
 # create a new spreadsheet from title
-def create_new_spreadsheet(service):
+def create_new_spreadsheet(service, sheetName):
     """
     Create a new Google Sheets spreadsheet.
 
-    This function prompts the user to enter the title for the new spreadsheet,
-    creates the spreadsheet with the specified title, and returns its ID.
+    This function creates the spreadsheet with the specified title and returns its ID.
 
     Parameters:
         service: An authenticated Google Sheets service object.
+        sheetName (str): The title of the new spreadsheet.
 
     Returns:
         str: The ID of the newly created spreadsheet.
 
+    Raises:
+        HttpError: An error occurred while creating the spreadsheet.
     """
     try:
-        # Prompt the user to enter the title of the new spreadsheet
-        sheetName = input("Please enter the title of the new spreadsheet: ")
-
         # Define the properties of the new spreadsheet
         spreadsheet = {"properties": {"title": sheetName}}
 
@@ -84,10 +96,12 @@ def create_new_spreadsheet(service):
     except HttpError as e:
         # Handle HTTP errors
         print(f"Error: {e}")
+        raise
 
     except Exception as e:
         # Handle unexpected errors
         print(f"Unexpected Error: {e}")
+        raise
 
 
 # change access permission of spreadsheet
@@ -101,6 +115,8 @@ def change_access_permission(spreadsheetId):
     Parameters:
         spreadsheetId (str): The ID of the Google Sheets spreadsheet.
 
+    Raises:
+        HttpError: An error occurred while updating the permissions.
     """
     # Authenticate with Google Drive API
     service = authenticate.driveAPI(SCOPES=SCOPES)
@@ -121,10 +137,12 @@ def change_access_permission(spreadsheetId):
     except HttpError as e:
         # Handle HTTP errors
         print(f"Error: {e}")
+        raise
 
     except Exception as e:
         # Handle unexpected errors
         print(f"Unexpected Error: {e}")
+        raise
 
 
 # write the dataframes to the spreadsheet
@@ -133,7 +151,8 @@ def write_to_sheet(service, dataframes, start_rows, spreadsheetId):
     Write data from DataFrame(s) to a Google Sheets spreadsheet.
 
     This function takes a list of DataFrames, their starting rows, and the spreadsheet ID.
-    It writes the data from each DataFrame to the spreadsheet, starting from the specified rows.
+    The headers and data of every DataFrame are assembled into a list of ranges, which is
+    written to the spreadsheet with a single `values().batchUpdate` request.
 
     Parameters:
         service: An authenticated Google Sheets service object.
@@ -141,10 +160,15 @@ def write_to_sheet(service, dataframes, start_rows, spreadsheetId):
         start_rows (list): A list of starting rows for each DataFrame in the spreadsheet.
         spreadsheetId (str): The ID of the Google Sheets spreadsheet.
 
+    Raises:
+        HttpError: An error occurred while writing to the spreadsheet.
     """
     try:
         print("Writing dataframes to spreadsheet...")
 
+        # Ranges to write, as expected by values().batchUpdate
+        ranges = []
+
         # Loop through each DataFrame
         for i in tqdm(range(len(dataframes))):
             data = dataframes[i].values.tolist()  # Convert DataFrame to list of lists
@@ -172,14 +196,8 @@ def write_to_sheet(service, dataframes, start_rows, spreadsheetId):
                         cols.append(columnss[j][1])
                         subs.append(columnss[j][0])
 
-                # Write sub-headers for the first DataFrame
-                body = {"values": [subs]}
-                service.spreadsheets().values().update(
-                    spreadsheetId=spreadsheetId,
-                    range="C1",
-                    valueInputOption="RAW",
-                    body=body,
-                ).execute()
+                # Sub-headers for the first DataFrame
+                ranges.append({"range": "C1", "values": [subs]})
 
             # Extract headers for subsequent DataFrames
             if i != 0:
@@ -187,30 +205,25 @@ def write_to_sheet(service, dataframes, start_rows, spreadsheetId):
             else:
                 headers = [cols]
 
-            # Write headers to the spreadsheet
-            body = {"values": headers}
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheetId,
-                range=f"A{start_rows[i]}",
-                valueInputOption="RAW",
-                body=body,
-            ).execute()
-
-            # Write data to the spreadsheet
-            body = {"values": data}
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheetId,
-                range=f"A{start_rows[i] + 1}",
-                valueInputOption="RAW",
-                body=body,
-            ).execute()
+            # Headers and data of the DataFrame
+            ranges.append({"range": f"A{start_rows[i]}", "values": headers})
+            ranges.append({"range": f"A{start_rows[i] + 1}", "values": data})
+
+        # Write every range to the spreadsheet in one request
+        body = {"valueInputOption": "RAW", "data": ranges}
+        service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheetId,
+            body=body,
+        ).execute()
 
         print("Writing Completed!!")
 
     except HttpError as e:
         # Handle HTTP errors
         print(f"Error: {e}")
+        raise
 
     except Exception as e:
         # Handle unexpected errors
         print(f"Unexpected Error: {e}")
+        raise
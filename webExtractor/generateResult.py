@@ -5,14 +5,11 @@ import threading
 import time
 from email.message import EmailMessage
 
-import authenticate
-import compute
-import driveSheetsOps
-
-# import pandas as pd
-import preprocessing
+import pandas as pd
 from pydantic import BaseModel, HttpUrl
 
+from webExtractor import authenticate, preprocessing, reportSinks
+
 
 class url(BaseModel):
     result_url: HttpUrl
@@ -23,6 +20,25 @@ lock = threading.Lock()
 SCOPES = authenticate.SCOPES
 
 
+class IncompleteScrapeError(RuntimeError):
+    """
+    Raised when some shards of a USN range could not be scraped.
+
+    Attributes:
+        missing (list): The (start_usn, end_usn, error) of every failed shard.
+        partial (DataFrame): The merged results of the shards that did finish.
+    """
+
+    def __init__(self, prefix_usn, missing, partial):
+        self.missing = missing
+        self.partial = partial
+        ranges = ", ".join(
+            f"{prefix_usn}{start:03d}-{prefix_usn}{end:03d} ({error!r})"
+            for start, end, error in missing
+        )
+        super().__init__(f"USNs not scraped: {ranges}")
+
+
 # send email
 def send_email(receiver_email, spreadsheetLink):
     """
@@ -70,7 +86,40 @@ def send_email(receiver_email, spreadsheetLink):
     print("Email sent successfully!!")
 
 
-def process_usn_range(thread_id, start_usn, end_usn, prefix_usn):
+def split_usn_range(start_usn, end_usn, num_workers):
+    """
+    Split a USN range into contiguous shards, one per worker.
+
+    Args:
+        start_usn (int): The starting USN number.
+        end_usn (int): The ending USN number.
+        num_workers (int): The number of workers to split the range across.
+
+    Returns:
+        list: A list of (start_usn, end_usn) tuples covering the whole range.
+    """
+    total = end_usn - start_usn + 1
+    num_workers = max(1, min(num_workers, total))
+    size, extra = divmod(total, num_workers)
+
+    shards = []
+    shard_start = start_usn
+    for worker in range(num_workers):
+        # The first `extra` shards take one more USN each
+        shard_end = shard_start + size - 1 + (1 if worker < extra else 0)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + 1
+    return shards
+
+
+async def process_usn_range(
+    thread_id,
+    start_usn,
+    end_usn,
+    prefix_usn,
+    result_url=preprocessing.RESULT_URL,
+    credits=None,
+):
     """
     Process the USN range within a thread.
 
@@ -79,33 +128,138 @@ def process_usn_range(thread_id, start_usn, end_usn, prefix_usn):
         start_usn (int): The starting USN number.
         end_usn (int): The ending USN number.
         prefix_usn (str): The prefix for the USNs.
+        result_url (str): The VTU results page to scrape.
+        credits (list, optional): The credits of each subject, read from credits.json when not given.
 
     Returns:
         DataFrame: A DataFrame containing the processed results for the specified USN range.
     """
     # Process the USN range
-    return preprocessing.processResults(thread_id, start_usn, end_usn, prefix_usn)
+    return await preprocessing.processResults(
+        thread_id, start_usn, end_usn, prefix_usn, result_url, credits
+    )
 
 
-def process_thread(thread_id, start_usn, end_usn, prefix_usn, results):
+def process_thread(
+    thread_id,
+    start_usn,
+    end_usn,
+    prefix_usn,
+    results,
+    result_url=preprocessing.RESULT_URL,
+    credits=None,
+    failures=None,
+):
     """
     Process a specific range of USNs within a thread.
 
+    Every thread runs its own event loop and its own WebDriver (created inside
+    `preprocessing.processResults`), so shards are scraped fully in parallel.
+
     Args:
         thread_id (int): The ID of the thread.
         start_usn (int): The starting USN number.
         end_usn (int): The ending USN number.
         prefix_usn (str): The prefix for the USNs.
         results (list): A list to store the results from each thread.
+        result_url (str): The VTU results page to scrape.
+        credits (list, optional): The credits of each subject, read from credits.json when not given.
+        failures (list, optional): Where a failed shard records its (start_usn, end_usn, error).
+            The error is raised in the thread when not given.
     """
     # Process a specific range of USNs in a thread
+    try:
+        result = asyncio.run(
+            process_usn_range(
+                thread_id, start_usn, end_usn, prefix_usn, result_url, credits
+            )
+        )
+    except Exception as e:
+        if failures is None:
+            raise
+        print(f"Thread {thread_id} failed on USNs {start_usn}-{end_usn}: {e!r}")
+        with lock:
+            failures.append((start_usn, end_usn, e))
+        return
+
     # Acquire the lock to ensure thread-safe access to the shared 'results' list
     # This prevents multiple threads from appending results simultaneously, avoiding data corruption
-    result = process_usn_range(thread_id, start_usn, end_usn, prefix_usn)
     with lock:
         results.append(result)
 
 
+def merge_results(results):
+    """
+    Merge the per-shard DataFrames into a single DataFrame ordered by USN.
+
+    Args:
+        results (list): The DataFrames returned by each thread, in any order.
+
+    Returns:
+        DataFrame: The combined DataFrame, indexed by USN and Name and sorted by USN.
+    """
+    # Shards without a single valid student carry no subject columns, skip them
+    frames = [result for result in results if not result.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    students_marks = pd.concat(frames)
+
+    # Threads finish in any order, sort so the output is deterministic
+    return students_marks.sort_index(level="USN", sort_remaining=False)
+
+
+def scrape_usn_range(
+    start_usn,
+    end_usn,
+    prefix_usn,
+    num_workers,
+    result_url=preprocessing.RESULT_URL,
+    credits=None,
+):
+    """
+    Scrape a USN range by splitting it across several worker threads.
+
+    Args:
+        start_usn (int): The starting USN number.
+        end_usn (int): The ending USN number.
+        prefix_usn (str): The prefix for the USNs.
+        num_workers (int): The number of workers (and WebDrivers) to use.
+        result_url (str): The VTU results page to scrape.
+        credits (list, optional): The credits of each subject, read from credits.json when not given.
+
+    Returns:
+        DataFrame: The combined results of all workers, sorted by USN.
+
+    Raises:
+        IncompleteScrapeError: If any shard failed, naming the USNs that were not scraped.
+    """
+    results = []
+    failures = []
+    threads = []
+    for thread_id, (shard_start, shard_end) in enumerate(
+        split_usn_range(start_usn, end_usn, num_workers)
+    ):
+        thread = threading.Thread(
+            target=process_thread,
+            args=(thread_id, shard_start, shard_end, prefix_usn, results),
+            kwargs={"result_url": result_url, "credits": credits, "failures": failures},
+        )
+        thread.start()
+        threads.append(thread)
+
+    # Wait for every worker to finish
+    for thread in threads:
+        thread.join()
+
+    # never hand back a report silently missing students
+    if failures:
+        raise IncompleteScrapeError(
+            prefix_usn, sorted(failures, key=lambda f: f[0]), merge_results(results)
+        )
+    return merge_results(results)
+
+
 async def generate_student_result():
     """
     Generate student results by processing multiple threads.
@@ -117,71 +271,49 @@ async def generate_student_result():
     start_usn = input("Enter the start USN number: ")
     end_usn = input("Enter the end USN number: ")
     prefix_usn = input("Enter the USN prefix: ")
+    num_workers = input("Enter the number of workers: ")
 
     start_time = time.time()
 
-    students_marks = await preprocessing.processResults(
-        0, int(start_usn), int(end_usn), prefix_usn
+    # Scrape the shards concurrently without blocking the event loop
+    students_marks = await asyncio.to_thread(
+        scrape_usn_range, int(start_usn), int(end_usn), prefix_usn, int(num_workers)
     )
     print("Students Marks:")
     print(students_marks)
 
-    # Extract top 10 students based on Percentage and SGPA
-    top10 = students_marks.sort_values(
-        by=[("Percentage", ""), ("SGPA", "")], ascending=False
-    )[:10][[("Total", ""), ("Percentage", ""), ("SGPA", "")]]
+    # Extract the top 10 students and the grades of all students
+    students_marks, top10, grades = reportSinks.reportFrames(students_marks)
     print("Top 10 Students:")
     print(top10)
-
-    # Compute grades for all students
-    grades = compute.grades(students_marks=students_marks)
     print("Grades:")
     print(grades)
 
-    # Reset index for dataframes
-    students_marks.reset_index(inplace=True)
-    top10.reset_index(inplace=True)
-    grades.reset_index(inplace=True)
-
-    # Authenticate with Google Sheets API
-    sheets = authenticate.sheetsAPI(SCOPES=SCOPES)
-
-    # Create a new spreadsheet
-    spreadsheetId = driveSheetsOps.create_new_spreadsheet(service=sheets)
-
-    # Change access permission for the spreadsheet
-    driveSheetsOps.change_access_permission(spreadsheetId=spreadsheetId)
-
-    # Define starting rows for each dataframe in the spreadsheet
-    start_rows = [
-        2,
-        len(students_marks) + 5,
-        len(students_marks) + len(top10) + 10,
-    ]
-
-    # Prepare dataframes to be written to the spreadsheet
-    dataframes = [students_marks, top10, grades]
+    # Publish the report to Google Sheets or a local XLSX / Parquet file
+    sink = reportSinks.chooseSink()
+    location = sink.write(students_marks, top10, grades)
 
-    # Write dataframes to the spreadsheet
-    driveSheetsOps.write_to_sheet(sheets, dataframes, start_rows, spreadsheetId)
-
-    # Generate the link to the spreadsheet
-    spreadsheet_link = f"https://docs.google.com/spreadsheets/d/{spreadsheetId}"
-
-    # Print the link to the spreadsheet
-    print(f"You can access the spreadsheet here: {spreadsheet_link}")
-
-    # Prompt user if they want to receive the link through mail
-    print("Do you want to receive the link through email?")
-    mail = int(input("Yes: 1 or No: 0: "))
-
-    # If user chooses to receive the link through email
-    if mail == 1:
-        receiver_email = input("Please enter your email id: ")
-        send_email(receiver_email, spreadsheet_link)
-        print("Thank you! The link has been sent to your email.")
-    else:
+    # Only a spreadsheet link can be shared through mail
+    if not isinstance(sink, reportSinks.SheetsSink):
+        print(f"The report has been written to: {location}")
         print("Thank you!")
+    else:
+        spreadsheet_link = location
+
+        # Print the link to the spreadsheet
+        print(f"You can access the spreadsheet here: {spreadsheet_link}")
+
+        # Prompt user if they want to receive the link through mail
+        print("Do you want to receive the link through email?")
+        mail = int(input("Yes: 1 or No: 0: "))
+
+        # If user chooses to receive the link through email
+        if mail == 1:
+            receiver_email = input("Please enter your email id: ")
+            send_email(receiver_email, spreadsheet_link)
+            print("Thank you! The link has been sent to your email.")
+        else:
+            print("Thank you!")
 
     print(f"Time taken: {time.time() - start_time} seconds")
 
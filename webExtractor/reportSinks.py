@@ -0,0 +1,230 @@
+import os
+from abc import ABC, abstractmethod
+
+from webExtractor import compute
+
+# number of rows converted and written at a time by the local writers
+CHUNK_ROWS = 1000
+
+# sheet (XLSX) and file (Parquet) names of the report frames, in order
+REPORT_NAMES = ["Students Marks", "Top 10", "Grades"]
+
+
+def _flat_columns(frame):
+    """
+    Flatten the (possibly MultiIndex) columns of a report frame into plain strings.
+
+    Parameters:
+        frame (DataFrame): One of the report frames.
+
+    Returns:
+        list: A list of column names, e.g. "21CS51 INT" for ("21CS51", "INT").
+    """
+    columns = []
+    for column in frame.columns:
+        if isinstance(column, tuple):
+            column = " ".join(str(part) for part in column if part != "")
+        columns.append(str(column))
+    return columns
+
+
+def _chunks(frame):
+    """Yield the rows of a frame as lists of plain Python values, CHUNK_ROWS at a time."""
+    for start in range(0, len(frame), CHUNK_ROWS):
+        yield frame.iloc[start : start + CHUNK_ROWS].values.tolist()
+
+
+# build the frames of a report from the students marks
+def reportFrames(students_marks):
+    """
+    Build the three report frames from the combined students marks.
+
+    Parameters:
+        students_marks (DataFrame): The marks, totals, percentage and SGPA of every student,
+            indexed by USN and Name.
+
+    Returns:
+        tuple: The students marks, top 10 students and grade distribution frames, with their
+               index reset, ready to be written by a sink.
+    """
+    # Extract top 10 students based on Percentage and SGPA
+    top10 = students_marks.sort_values(
+        by=[("Percentage", ""), ("SGPA", "")], ascending=False
+    )[:10][[("Total", ""), ("Percentage", ""), ("SGPA", "")]]
+
+    # Compute grades for all students
+    grades = compute.grades(students_marks=students_marks)
+
+    # Reset index for dataframes
+    students_marks = students_marks.reset_index()
+    top10 = top10.reset_index()
+    grades = grades.reset_index()
+
+    return students_marks, top10, grades
+
+
+class ReportSink(ABC):
+    """
+    A place result reports are published to.
+
+    A report is made of the students marks, top 10 students and grade distribution frames,
+    with their index already reset.
+    """
+
+    @abstractmethod
+    def write(self, students_marks, top10, grades):
+        """
+        Publish a report.
+
+        Parameters:
+            students_marks (DataFrame): The marks, totals, percentage and SGPA of every student.
+            top10 (DataFrame): The top 10 students by percentage and SGPA.
+            grades (DataFrame): The grade distribution of every subject.
+
+        Returns:
+            str: Where the report can be found (a link or a local path).
+        """
+
+
+class SheetsSink(ReportSink):
+    """Publish the report to a new Google Sheets spreadsheet anyone with the link can edit."""
+
+    def __init__(self, title):
+        self.title = title
+
+    def write(self, students_marks, top10, grades):
+        # imported here so local reports never touch the Google APIs
+        from webExtractor import authenticate, driveSheetsOps
+
+        # Authenticate with Google Sheets API
+        sheets = authenticate.sheetsAPI(SCOPES=authenticate.SCOPES)
+
+        # Create a new spreadsheet
+        spreadsheetId = driveSheetsOps.create_new_spreadsheet(
+            service=sheets, sheetName=self.title
+        )
+
+        # Change access permission for the spreadsheet
+        driveSheetsOps.change_access_permission(spreadsheetId=spreadsheetId)
+
+        # Define starting rows for each dataframe in the spreadsheet
+        start_rows = [
+            2,
+            len(students_marks) + 5,
+            len(students_marks) + len(top10) + 10,
+        ]
+
+        # Write dataframes to the spreadsheet
+        dataframes = [students_marks, top10, grades]
+        driveSheetsOps.write_to_sheet(sheets, dataframes, start_rows, spreadsheetId)
+
+        # Generate the link to the spreadsheet
+        return f"https://docs.google.com/spreadsheets/d/{spreadsheetId}"
+
+
+class XLSXSink(ReportSink):
+    """
+    Write the report to a local XLSX workbook, one sheet per frame.
+
+    The workbook is opened in openpyxl's write-only mode, which streams rows to disk as
+    they are appended, so memory use does not grow with the number of students.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, students_marks, top10, grades):
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        for name, frame in zip(REPORT_NAMES, [students_marks, top10, grades]):
+            sheet = workbook.create_sheet(title=name)
+            sheet.append(_flat_columns(frame))
+            for rows in _chunks(frame):
+                for row in rows:
+                    sheet.append(row)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        workbook.save(self.path)
+
+        return os.path.abspath(self.path)
+
+
+class ParquetSink(ReportSink):
+    """
+    Write the report to a folder of Parquet files, one file per frame, for analytics.
+
+    Every frame is converted and written CHUNK_ROWS rows at a time, one row group each.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def write(self, students_marks, top10, grades):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(self.folder, exist_ok=True)
+        for name, frame in zip(REPORT_NAMES, [students_marks, top10, grades]):
+            frame = frame.set_axis(_flat_columns(frame), axis=1)
+
+            # marks are kept as text, so every chunk shares the schema of the whole frame
+            schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            path = os.path.join(
+                self.folder, f"{name.lower().replace(' ', '_')}.parquet"
+            )
+            with pq.ParquetWriter(path, schema) as writer:
+                for start in range(0, len(frame), CHUNK_ROWS):
+                    chunk = frame.iloc[start : start + CHUNK_ROWS]
+                    writer.write_table(
+                        pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                    )
+
+        return os.path.abspath(self.folder)
+
+
+# create the sink of a report destination
+def makeSink(kind, output=None, title=None):
+    """
+    Create the sink for a report destination.
+
+    Parameters:
+        kind (str): "sheets", "xlsx" or "parquet".
+        output (str, optional): The XLSX file or Parquet folder path of the local sinks.
+        title (str, optional): The title of the Google Sheets spreadsheet, required for
+            Google Sheets reports.
+
+    Returns:
+        ReportSink: The sink to publish the report with.
+
+    Raises:
+        ValueError: The kind is unknown, a local sink has no output path or a Google
+            Sheets sink has no title.
+    """
+    if kind == "sheets":
+        if not title:
+            raise ValueError("A title is required for sheets reports")
+        return SheetsSink(title)
+    if kind not in ("xlsx", "parquet"):
+        raise ValueError(f"Unknown report kind: {kind}")
+    if not output:
+        raise ValueError(f"An output path is required for {kind} reports")
+    return XLSXSink(output) if kind == "xlsx" else ParquetSink(output)
+
+
+# ask the user where the report should be published
+def chooseSink():
+    """
+    Prompt the user for the report destination.
+
+    Returns:
+        ReportSink: The sink to publish the report with.
+    """
+    print("Where do you want to publish the results?")
+    choice = int(input("Google Sheets: 1, XLSX: 2 or Parquet: 3: "))
+    if choice == 2:
+        return makeSink("xlsx", input("Please enter the XLSX file path: "))
+    if choice == 3:
+        return makeSink("parquet", input("Please enter the Parquet folder path: "))
+    return makeSink(
+        "sheets", title=input("Please enter the title of the new spreadsheet: ")
+    )
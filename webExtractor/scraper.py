@@ -32,13 +32,13 @@ def solve_captcha(driver) -> str:
     # Find the captcha image element on the webpage
     div_element = driver.find_element("xpath", '//*[@id="raj"]/div[2]/div[2]/img')
 
-    # Take a screenshot of the captcha image
-    div_element.screenshot(r"/EduInsights/webExtractor/captcha.png")
+    # Take a screenshot of the captcha image, one file per driver session so that
+    # concurrent workers don't overwrite each other's captcha
+    captcha_path = f"/EduInsights/webExtractor/captcha_{driver.session_id}.png"
+    div_element.screenshot(captcha_path)
 
     # Solve the captcha using the trueCaptcha solver
-    captcha = trueCaptcha.solve_captcha(
-        "/EduInsights/webExtractor/captcha.png",
-    )
+    captcha = trueCaptcha.solve_captcha(captcha_path)
 
     return captcha
 